@@ -1,20 +1,198 @@
 # OU3.py - Over/Under threshold alert satellite
 # This class extends BaseAlert and must implement check(match) only.
 
+import functools
 import logging
-import json
 import sys
 from pathlib import Path
-from typing import Dict, Optional, Union, Any
+from typing import Callable, Dict, Final, List, Optional, Tuple, Any
 
 try:
     from .base_alert import Alert
-    from .format_utils import format_match_summary
 except ImportError:
     # Fallback if importing from relative path fails
     sys.path.append(str(Path(__file__).parent.parent))
     from Alerts.base_alert import Alert
-    from Alerts.format_utils import format_match_summary
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; without it large batches use the scalar loop
+    np = None
+
+try:
+    import msgpack
+    _PACKER = msgpack.Packer(use_bin_type=True)
+except ImportError:
+    # msgpack is optional; only check_msgpack() needs it
+    _PACKER = None
+
+# Alert payload keys interned once so every fired payload shares the same key objects
+_K_TYPE: Final = sys.intern("type")
+_K_LINE: Final = sys.intern("line")
+_K_OVER: Final = sys.intern("over")
+_K_UNDER: Final = sys.intern("under")
+_K_THRESHOLD: Final = sys.intern("threshold")
+_K_TIMESTAMP: Final = sys.intern("timestamp")
+_K_DETAIL: Final = sys.intern("detail")
+# Pre-bound formatter for the payload detail string
+_DETAIL_FMT: Final = "Over/Under Line: {:.2f}".format
+
+# Status IDs typically: 1=Not Started, 2=First Half, 3=Halftime, 4=Second Half, 5=Finished
+# Stored as integers only, we'll convert strings to integers when checking
+_VALID_STATUS_IDS: Final = frozenset({2, 3, 4})
+
+# Shared read-only default for matches without odds, so no empty dict is
+# allocated per match (never mutate it)
+_EMPTY_DICT: Final[Dict[str, Any]] = {}
+
+# Batches at least this large compare lines against the threshold with NumPy
+_VECTORIZE_MIN: Final = 1000
+
+
+@functools.lru_cache(maxsize=2048)
+def _str_to_float(s: str) -> Optional[float]:
+    """Parse a numeric string, cached because polled payloads repeat the same strings."""
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _str_to_int(s: str) -> Optional[int]:
+    """Parse an integer string, cached because polled payloads repeat the same strings."""
+    try:
+        return int(s)
+    except ValueError:
+        return None
+
+
+def _to_float(x: Any, default: Optional[float] = None) -> Optional[float]:
+    """Coerce x to float, taking a no-exception fast path for numeric input."""
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        return float(x)
+    if t is str:
+        v = _str_to_float(x)
+        return default if v is None else v
+    return default
+
+
+def _to_int(x: Any, default: Optional[int] = None) -> Optional[int]:
+    """Coerce x to int, taking a no-exception fast path for numeric input."""
+    t = type(x)
+    if t is int:
+        return x
+    if t is str:
+        v = _str_to_int(x)
+        return default if v is None else v
+    if t is float:
+        try:
+            return int(x)
+        except (ValueError, OverflowError):
+            return default
+    return default
+
+
+def _team_name(m: Dict[str, Any], k: str, fb: str) -> str:
+    """Resolve a team name from either a nested {"name": ...} dict or a non-empty string."""
+    t = m.get(k)
+    if type(t) is dict:
+        return t.get("name", "Unknown")
+    if type(t) is str and t:
+        return t
+    return m.get(fb, "Unknown")
+
+
+def _latest_entry(ou_map: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the most recent over_under entry, or None if the map has none."""
+    # Plain linear scan instead of max(key=...) avoids a key call per entry
+    entry = None
+    best_ts = None
+    try:
+        for e in ou_map.values():
+            ts = e.get("timestamp", 0)
+            if entry is None or ts > best_ts:
+                best_ts = ts
+                entry = e
+    except AttributeError:
+        return None
+    return entry
+
+
+def _bs_entry(bs: Any) -> Optional[Dict[str, Any]]:
+    """Convert the first raw bs row [timestamp, minute, over, line, under] to an entry dict."""
+    if bs and type(bs) is list:
+        row = bs[0]
+        if type(row) is list and len(row) >= 4:
+            return {
+                "line": row[3],
+                "over": row[2],
+                "under": row[4] if len(row) > 4 else 0,
+                "timestamp": row[0],
+            }
+    return None
+
+
+def _extract_ou_line(
+    odds: Dict[str, Any]
+) -> Tuple[Optional[float], Optional[Dict[str, Any]], str]:
+    """Locate the current Over/Under line in any known odds payload shape.
+    
+    Dispatches once on the keys present in odds: the summary over_under map
+    first, then the legacy markets list, direct bs rows, nested results bs
+    rows and betting.over_under block.
+    
+    Returns:
+        (line, entry, source) where entry carries over/under/timestamp,
+        or (None, None, "none") if no usable line was found
+    """
+    # Each source is fetched exactly once with a walrus-guarded lookup and
+    # falls through to the next shape when it yields no usable line
+    if (ou_map := odds.get("over_under")) and type(ou_map) is dict:
+        if (entry := _latest_entry(ou_map)) is not None:
+            if (line := _to_float(entry.get("line", 0))) is not None:
+                return line, entry, "over_under"
+    
+    if markets := odds.get("markets"):
+        for m in markets:
+            if m.get("type") == "OVER_UNDER" and (line := _to_float(m.get("line"))) is not None:
+                return line, m, "markets"
+    
+    if (entry := _bs_entry(odds.get("bs"))) is not None:
+        if (line := _to_float(entry["line"])) is not None:
+            return line, entry, "direct_bs"
+    
+    if (results := odds.get("results")) and type(results) is dict:
+        for mk in results.values():
+            if type(mk) is dict and (entry := _bs_entry(mk.get("bs"))) is not None:
+                if (line := _to_float(entry["line"])) is not None:
+                    return line, entry, "nested_bs"
+    
+    if (betting := odds.get("betting")) and type(betting) is dict:
+        if (ou := betting.get("over_under")) and type(ou) is dict:
+            if (line := _to_float(ou.get("line"))) is not None:
+                return line, ou, "betting"
+    
+    return None, None, "none"
+
+
+def _make_payload(name: str, line: float, entry: Dict[str, Any], thr: float) -> Dict[str, Any]:
+    """Build the alert payload for a fired match."""
+    return {
+        _K_TYPE: name,
+        _K_LINE: line,
+        # Over and under values default to 0.0 when invalid
+        _K_OVER: _to_float(entry.get("over", 0), 0.0),
+        _K_UNDER: _to_float(entry.get("under", 0), 0.0),
+        _K_THRESHOLD: thr,
+        _K_TIMESTAMP: entry.get("timestamp"),
+        _K_DETAIL: _DETAIL_FMT(line)
+    }
+
 
 class OverUnderAlert(Alert):
     """
@@ -22,11 +200,12 @@ class OverUnderAlert(Alert):
     and the match is currently in first half, halftime, or second half.
     """
     
+    __slots__ = ("threshold",)
+    
     # Default parameters that can be overridden by config
     DEFAULT_PARAMS = {"threshold": 3.0}
-    # Status IDs typically: 1=Not Started, 2=First Half, 3=Halftime, 4=Second Half, 5=Finished
-    # Define valid status IDs as integers only, we'll convert strings to integers when checking
-    VALID_STATUS_IDS = {2, 3, 4}
+    # Live status IDs (first half, halftime, second half)
+    VALID_STATUS_IDS = _VALID_STATUS_IDS
 
     def __init__(self, threshold: float = 3.0):
         # Use consistent name 'OU3' to match config keys and log filenames
@@ -46,65 +225,155 @@ class OverUnderAlert(Alert):
         Returns:
             Alert payload dict or None if criteria not met
         """
-        match_id = match.get("match_id", "unknown")
+        return self.check_batch([match])[0]
+
+    def check_msgpack(self, match: Dict[str, Any]) -> Optional[bytes]:
+        """MsgPack-encoded variant of check() for network or disk sinks
         
-        # Guard on Game Status
-        try:
-            status_id = int(match.get("status_id", 0))
-        except (ValueError, TypeError):
-            self.logger.debug(f"Match {match_id}: Invalid status_id format")
-            return None
+        Returns the payload as MsgPack bytes so callers writing to a wire or
+        file can concatenate fired alerts and skip a JSON encode.
+        
+        Args:
+            match: Enriched match object from merge_logic.py
+            
+        Returns:
+            Encoded alert payload or None if criteria not met
             
-        if status_id not in self.VALID_STATUS_IDS:
-            self.logger.debug(f"Match {match_id}: Status {status_id} not in valid statuses {self.VALID_STATUS_IDS}")
-            return None
+        Raises:
+            RuntimeError: If msgpack is not installed
+        """
+        if _PACKER is None:
+            raise RuntimeError("msgpack is required for OverUnderAlert.check_msgpack()")
+        payload = self.check(match)
+        return None if payload is None else _PACKER.pack(payload)
+
+    @classmethod
+    def compile(cls, threshold: float = 3.0) -> Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Build a standalone check(match) for callers looping over matches themselves
         
-        # Pull Over/Under Map
-        odds = match.get("odds", {})
-        ou_map = odds.get("over_under", {})
+        The threshold, status set and alert name are bound once as closure
+        variables, so each call skips the attribute lookups and the
+        one-element batch that check() goes through. Like the vectorized
+        batch path, the closure does no logging.
         
-        if not isinstance(ou_map, dict) or not ou_map:
-            self.logger.debug(f"Match {match_id}: No over_under data found or invalid format")
-            return None
+        Args:
+            threshold: Over/Under line that must be exceeded
+            
+        Returns:
+            Function taking a match and returning the alert payload or None
+        """
+        alert = cls(threshold)
+        thr = alert.threshold
+        name = alert.name
+        valid = _VALID_STATUS_IDS
         
-        # Find the Most Recent Entry
-        try:
-            latest_entry = max(ou_map.values(), key=lambda e: e.get("timestamp", 0))
-        except (ValueError, AttributeError):
-            self.logger.debug(f"Match {match_id}: Could not determine latest over_under entry")
-            return None
+        def check(match: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            if _to_int(match.get("status_id", 0)) not in valid:
+                return None
+            line, entry, _ = _extract_ou_line(match.get("odds") or _EMPTY_DICT)
+            if line is None or line <= thr:
+                return None
+            return _make_payload(name, line, entry, thr)
         
-        # Threshold Check
-        try:
-            line = float(latest_entry.get("line", 0))
-        except (ValueError, TypeError):
-            self.logger.debug(f"Match {match_id}: Invalid line format")
-            return None
+        return check
+
+    def check_batch(self, matches: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Check a list of matches in a single pass
         
-        if line <= self.threshold:
-            self.logger.debug(f"Match {match_id}: Line {line} is below threshold {self.threshold}")
-            return None
+        Binds the threshold, valid status set and debug flag to locals once so
+        the per-match loop avoids repeated attribute lookups, and emits one
+        summary log line for the whole batch instead of one per fired alert.
         
-        # Return Alert Payload
-        self.logger.info(f"Match {match_id}: Line {line} exceeds threshold {self.threshold}")
+        Args:
+            matches: Enriched match objects from merge_logic.py
+            
+        Returns:
+            List aligned with matches holding the alert payload or None
+        """
+        logger = self.logger
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if np is not None and not debug and len(matches) >= _VECTORIZE_MIN:
+            return self._check_batch_vectorized(matches)
         
-        # Extract both over and under values with proper error handling
-        try:
-            over_value = float(latest_entry.get("over", 0))
-        except (ValueError, TypeError):
-            over_value = 0.0
+        valid = _VALID_STATUS_IDS
+        thr = self.threshold
+        name = self.name
+        out: List[Optional[Dict[str, Any]]] = [None] * len(matches)
+        fired = 0
+        
+        for i, match in enumerate(matches):
+            # match_id is only used in debug messages, so skip the lookup otherwise
+            match_id = match.get("match_id", "unknown") if debug else None
             
-        try:
-            under_value = float(latest_entry.get("under", 0))
-        except (ValueError, TypeError):
-            under_value = 0.0
-        
-        return {
-            "type": self.name,
-            "line": line,
-            "over": over_value,
-            "under": under_value,
-            "threshold": self.threshold,
-            "timestamp": latest_entry.get("timestamp"),
-            "detail": f"Over/Under Line: {line:.2f}"
-        }
+            # Guard on Game Status first - most matches are not live and are filtered here
+            status_id = _to_int(match.get("status_id", 0))
+            if status_id is None:
+                if debug:
+                    logger.debug("Match %s: Invalid status_id format", match_id)
+                continue
+                
+            if status_id not in valid:
+                if debug:
+                    logger.debug("Match %s: Status %s not in valid statuses %s", match_id, status_id, valid)
+                continue
+            
+            # Locate the current Over/Under line
+            line, latest_entry, source = _extract_ou_line(match.get("odds") or _EMPTY_DICT)
+            if line is None:
+                if debug:
+                    logger.debug("Match %s: No usable over/under line found", match_id)
+                continue
+            
+            if line <= thr:
+                if debug:
+                    logger.debug("Match %s: Line %s is below threshold %s", match_id, line, thr)
+                continue
+            
+            if debug:
+                # Team names are only needed for this log line, so resolve them lazily
+                home = _team_name(match, "home_team", "home")
+                away = _team_name(match, "away_team", "away")
+                logger.debug("Match %s (%s vs %s): Line %s (%s) exceeds threshold %s",
+                             match_id, home, away, line, source, thr)
+            
+            out[i] = _make_payload(name, line, latest_entry, thr)
+            fired += 1
+        
+        if fired:
+            logger.info("fired %d/%d OU3 alerts", fired, len(matches))
+        return out
+
+    def _check_batch_vectorized(self, matches: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """NumPy variant of check_batch for large batches
+        
+        Status filtering and line extraction still walk the match dicts, but
+        the threshold comparison runs as one array operation and payloads are
+        only built for the matches that fired. Debug logging is not supported
+        here; check_batch uses the scalar loop when DEBUG is enabled.
+        """
+        valid = _VALID_STATUS_IDS
+        out: List[Optional[Dict[str, Any]]] = [None] * len(matches)
+        
+        # Collect live matches with a usable line
+        idx: List[int] = []
+        extracted: List[Tuple[float, Dict[str, Any]]] = []
+        for i, match in enumerate(matches):
+            if _to_int(match.get("status_id", 0)) not in valid:
+                continue
+            line, entry, _ = _extract_ou_line(match.get("odds") or _EMPTY_DICT)
+            if line is not None:
+                idx.append(i)
+                extracted.append((line, entry))
+        
+        thr = self.threshold
+        name = self.name
+        lines = np.fromiter((e[0] for e in extracted), dtype=np.float64, count=len(extracted))
+        # Negated <= so NaN lines fire here exactly as they do in the scalar loop
+        hits = np.flatnonzero(~(lines <= thr))
+        for j in hits.tolist():
+            line, entry = extracted[j]
+            out[idx[j]] = _make_payload(name, line, entry, thr)
+        
+        if len(hits):
+            self.logger.info("fired %d/%d OU3 alerts", len(hits), len(matches))
+        return out
@@ -35,25 +35,39 @@
 ############################################################################
 
 import os
+import re
 import sys
 import json
+import mmap
 import time
 import inspect
+import functools
 import importlib
-import importlib.util
 from pathlib import Path
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Type, Optional
+from typing import Callable, Dict, List, Any, Type, Optional, Tuple
 
 # Import our base alert class to enable discovery of subclasses
 try:
-    from .base_alert import Alert
+    from .base_alert import Alert, _ALERT_REGISTRY
 except ImportError:
     # Fallback if importing from relative path fails
     sys.path.append(str(Path(__file__).parent.parent))
-    from Alerts.base_alert import Alert
+    from Alerts.base_alert import Alert, _ALERT_REGISTRY
 from zoneinfo import ZoneInfo
+import requests
+from requests.adapters import HTTPAdapter
+
+# Prefer orjson's C encoder for seen-state files; the format is plain JSON either way
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
 
 # Add the parent directory to sys.path to ensure imports work correctly
 sys.path.append(str(Path(__file__).parent.parent))
@@ -69,19 +83,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import our custom formatting utilities
 try:
-    from .format_utils import format_match_summary
+    from .format_utils import format_match_summary, _normalize_match
 except ImportError:
     # Fallback if importing from relative path fails
-    from Alerts.format_utils import format_match_summary
+    from Alerts.format_utils import format_match_summary, _normalize_match
     
-from combined_match_summary import (
-    get_eastern_time, 
-    format_odds_display, 
-    summarize_environment,
-    get_status_description,
-    transform_odds,
-    API_DATETIME_FORMAT
-)
+from combined_match_summary import get_eastern_time, API_DATETIME_FORMAT
 
 # Configure root logger for console output
 root_logger = logging.getLogger()
@@ -96,246 +103,141 @@ TELEGRAM_TOKEN = "7764953908:AAHMpJsw5vKQYPiJGWrj0PgDkztiIgY_dko"
 CHAT_ID = "6128359776"
 TELEGRAM_URL = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
 
+# Shared session so consecutive notifications reuse one keep-alive TLS connection
+_TG_SESSION = requests.Session()
+_TG_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Highlighted detail (*...*) in legacy string alerts
+_ALERT_DETAIL_RE = re.compile(r'\*(.+?)\*')
+
+# Rule framing the alert header above each match summary
+_ALERT_RULE = "====================================="
 
-def send_notification(message: str):
-    """Send a Telegram notification."""
+# Pre-bound formatter for the highlighted OU3 alert line
+_OU3_VALUE_FMT = "Over/Under Line: *{:.2f}* (Threshold: {})".format
+
+
+def _format_ou3_details(alert_data: Dict[str, Any]) -> List[str]:
+    """Detail lines for a structured OU3 alert."""
+    if "value" in alert_data and "threshold" in alert_data:
+        # Format the O/U value with highlighting
+        return [_OU3_VALUE_FMT(alert_data['value'], alert_data['threshold'])]
+    if "detail" in alert_data:
+        # Use the provided detail field
+        return [f"{alert_data['detail']}"]
+    return []
+
+
+def _format_generic_details(alert_data: Dict[str, Any]) -> List[str]:
+    """Detail lines for alert types without a dedicated formatter: one per field.
+    
+    Fields are listed last-to-first, the order the old per-field insert produced.
+    """
+    return [f"{key.capitalize()}: {value}" for key, value in reversed(alert_data.items()) if key != "type"]
+
+
+# Structured alert formatters keyed by upper-cased alert type; add new types here
+_ALERT_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    "OU3": _format_ou3_details,
+}
+
+
+def _read_seen_file(path: str) -> set:
+    """Load a .seen.json file straight into a set of IDs.
+    
+    With orjson the array is parsed directly from a read-only mmap of the
+    file, skipping the intermediate bytes copy of f.read().
+    """
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return set(json.loads(f.read()))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+            return set(orjson.loads(buf))
+
+
+def send_notification(message: str) -> bool:
+    """Send a Telegram notification, returning True if Telegram accepted it."""
     payload = {
         "chat_id": CHAT_ID,
         "text": message,
         "parse_mode": "Markdown"
     }
     try:
-        resp = requests.post(TELEGRAM_URL, json=payload, timeout=5)
+        resp = _TG_SESSION.post(TELEGRAM_URL, json=payload, timeout=5)
         resp.raise_for_status()
     except Exception as e:
         print(f"Failed to send notification: {e}")
+        return False
+    return True
+
 
+# Files in the Alerts directory that never define alert satellites
+_NON_ALERT_FILES = frozenset({"alerter_main.py", "base_alert.py"})
 
-def format_match_summary(match):
-    """Format match data exactly like combined_match_summary.py does.
-    This is a direct duplicate of the formatting code from combined_match_summary.py
-    to ensure consistent pretty-printing throughout the system.
+
+def _alerts_dir_signature(alerts_dir: Path) -> Tuple[Tuple[str, int], ...]:
+    """Return (filename, mtime_ns) for every candidate alert module.
+    
+    Used as the cache key for _scan_alerts_dir, so adding, removing or
+    editing an alert file triggers a rescan while unrelated files written
+    to the folder (logs, seen state) do not.
+    """
+    with os.scandir(alerts_dir) as entries:
+        return tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns)
+            for entry in entries
+            if entry.name.endswith(".py")
+            and not entry.name.startswith("__")
+            and entry.name not in _NON_ALERT_FILES
+        ))
+
+
+# mtime_ns of each alert module as of its last import, to detect edits
+_loaded_mtimes: Dict[str, int] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_alerts_dir(alerts_dir: Path, signature: Tuple[Tuple[str, int], ...]) -> Dict[str, Type[Alert]]:
+    """Import the alert modules and collect the Alert subclasses they registered.
+    
+    Modules go through the normal package import, so each is executed once per
+    process and only reloaded when its file changes. Alert.__init_subclass__
+    records every subclass in _ALERT_REGISTRY as the module runs.
     
     Args:
-        match: The enriched match object from merge_logic
+        alerts_dir: Directory holding the alert satellites
+        signature: Result of _alerts_dir_signature(alerts_dir), the cache key
         
     Returns:
-        List of formatted strings representing the match summary
+        Dict mapping class name to Alert subclass
     """
-    lines = []
-    
-    # Headers and basic info
-    lines.append("\n----- MATCH SUMMARY -----")
-    lines.append("-------------------------")
-    lines.append("")
-    lines.append(f"Timestamp: {get_eastern_time().strftime(API_DATETIME_FORMAT)}")
-    
-    # Try both ID formats
-    match_id = match.get('id') or match.get('match_id', 'Unknown')
-    lines.append(f"Match ID: {match_id}")
-    
-    # Competition info - handle both string format and object format
-    competition = match.get('competition', {})
-    comp_id = None
-    comp_name = None
-    comp_country = None
-    
-    if isinstance(competition, str):
-        # Direct string format
-        comp_name = competition
-        comp_id = match.get('competition_id', 'Unknown')
-        comp_country = match.get('country', 'Unknown Country')
-    elif isinstance(competition, dict):
-        # Object format
-        comp_id = competition.get('id')
-        comp_name = competition.get('name')
-        comp_country = competition.get('country')
-    else:
-        # Alternative key formats
-        comp_id = match.get('competition_id')
-        comp_name = match.get('competition_name')
-        comp_country = match.get('country') or match.get('competition_country')
-    
-    # Apply defaults if still missing
-    comp_id = comp_id or 'Unknown'
-    comp_name = comp_name or 'Unknown'
-    comp_country = comp_country or 'Unknown Country'
-    
-    lines.append(f"Competition ID: {comp_id}")
-    lines.append(f"Competition: {comp_name} ({comp_country})")
-    
-    # Team names with fallbacks for different structures
-    home_team = None
-    away_team = None
-    
-    # String access
-    home_team = match.get('home_team')
-    away_team = match.get('away_team')
-    
-    # Object structure access
-    if not isinstance(home_team, str) and match.get('home_team', {}).get('name'):
-        home_team = match.get('home_team', {}).get('name')
-    if not isinstance(away_team, str) and match.get('away_team', {}).get('name'):
-        away_team = match.get('away_team', {}).get('name')
-    
-    # Alternate keys
-    home_team = home_team or match.get('home', 'Unknown')
-    away_team = away_team or match.get('away', 'Unknown')
-    
-    lines.append(f"Match: {home_team} vs {away_team}")
-    
-    # Score handling for both object and array structures
-    home_live = 0
-    home_ht = 0
-    away_live = 0
-    away_ht = 0
-    
-    # Object structure
-    score = match.get('score', {})
-    if isinstance(score, dict):
-        home_live = score.get('home', 0) 
-        away_live = score.get('away', 0)
-        home_ht = score.get('home_ht', 0)
-        away_ht = score.get('away_ht', 0)
-    # Array structure (from original data source)
-    elif isinstance(score, list) and len(score) > 3:
-        hs, as_ = score[2], score[3]
-        if isinstance(hs, list) and len(hs) > 1:
-            home_live, home_ht = hs[0], hs[1]
-        if isinstance(as_, list) and len(as_) > 1:
-            away_live, away_ht = as_[0], as_[1]
-    
-    lines.append(f"Score: {home_live} - {away_live} (HT: {home_ht} - {away_ht})")
-    
-    # Status with rich description
-    status_id = match.get('status_id')
-    status = match.get('status', get_status_description(status_id))
-    lines.append(f"Status: {status} (Status ID: {status_id})")
-    
-    # Betting Odds section
-    lines.append("\n--- MATCH BETTING ODDS ---")
-    lines.append("--------------------------")
-    lines.append("")
-    odds_data = match.get('odds', {})
+    # Use project's logging system for discovery process
+    logger = configure_alert_logger("alert_discovery")
+    package = __package__ or alerts_dir.name
+    modules = {}
     
-    # Handle both market array and object structures
-    ml_market = None
-    spread_market = None
-    ou_market = None
-    minute = "4"
-    
-    # Extract markets by type
-    markets = odds_data.get('markets', [])
-    if markets:
-        for market in markets:
-            market_type = market.get('type')
-            if market_type == 'MONEYLINE':
-                ml_market = market
-            elif market_type == 'SPREAD':
-                spread_market = market
-            elif market_type == 'OVER_UNDER':
-                ou_market = market
-                
-        # Format exactly as in example
-        odds_lines = []
-        
-        # Moneyline odds
-        if ml_market:
-            home = ml_market.get('home', 0)
-            draw = ml_market.get('draw', 0)
-            away = ml_market.get('away', 0)
-            
-            # Format to match +130 style
-            home_str = f"{int(float(home) * 100):+d}" if home else "+0"
-            draw_str = f"{int(float(draw) * 100):+d}" if draw else "+0"
-            away_str = f"{int(float(away) * 100):+d}" if away else "+0"
-            
-            ml_line = f"│ Home  : {home_str} │ Draw  : {draw_str} │ Away  : {away_str} │ (@{minute}')"
-            odds_lines.append(ml_line)
-        
-        # Spread odds
-        if spread_market:
-            home = spread_market.get('home', 0)
-            handicap = spread_market.get('handicap', 0)
-            away = spread_market.get('away', 0)
-            
-            # Format to match -133 style
-            home_str = f"{int(float(home) * 100):+d}" if home else "+0"
-            handicap_str = f"{float(handicap):.1f}" if handicap else "0.0"
-            away_str = f"{int(float(away) * 100):+d}" if away else "+0"
-            
-            spread_line = f"│ Home  : {home_str} │ Hcap  : {handicap_str} │ Away  : {away_str} │ (@{minute}')"
-            odds_lines.append(spread_line)
-        
-        # Over/Under odds
-        if ou_market:
-            over = ou_market.get('over', 0)
-            line = ou_market.get('line', 0)
-            under = ou_market.get('under', 0)
-            
-            # Format to match -111 style
-            over_str = f"{int(float(over) * 100):+d}" if over else "+0"
-            line_str = f"{float(line):.1f}" if line else "0.0"
-            under_str = f"{int(float(under) * 100):+d}" if under else "+0"
-            
-            ou_line = f"│ Over  : {over_str} │ Line  : {line_str} │ Under : {under_str} │ (@{minute}')"
-            odds_lines.append(ou_line)
-            
-        # Add all odds lines
-        if odds_lines:
-            lines.extend(odds_lines)
-        else:
-            lines.append("No betting odds available")
-    else:
-        # Try format_odds_display as fallback for any other odds format
-        formatted_odds = {
-            "ML": transform_odds(odds_data.get("eu", []), "eu"),
-            "SPREAD": transform_odds(odds_data.get("asia", []), "asia"),
-            "Over/Under": transform_odds(odds_data.get("bs", []), "bs")
-        }
-        odds_display = format_odds_display(formatted_odds)
-        lines.append(odds_display)
-    
-    # Environment data
-    lines.append("\n--- MATCH ENVIRONMENT ---")
-    lines.append("-------------------------")
-    lines.append("")
-    env_data = match.get('environment', {})
+    for file_name, mtime_ns in signature:
+        module_name = f"{package}.{Path(file_name).stem}"
+        try:
+            module = sys.modules.get(module_name)
+            if module is None:
+                importlib.import_module(module_name)
+            elif _loaded_mtimes.get(file_name, mtime_ns) != mtime_ns:
+                importlib.reload(module)
+            _loaded_mtimes[file_name] = mtime_ns
+            modules[module_name] = file_name
+        except Exception as e:
+            logger.error(f"Error importing {file_name}: {e}")
     
-    # Format environment exactly as in the example
-    if isinstance(env_data, dict):
-        weather = env_data.get('weather', {})
-        if isinstance(weather, dict):
-            # Temperature
-            if 'temperature' in weather:
-                try:
-                    temp_c = float(weather['temperature'])
-                    temp_f = temp_c * 9/5 + 32
-                    lines.append(f"Temperature: {temp_f:.1f}°F")
-                except (ValueError, TypeError):
-                    pass
-            
-            # Humidity
-            if 'humidity' in weather:
-                try:
-                    humidity = int(weather['humidity'])
-                    lines.append(f"Humidity: {humidity}%")
-                except (ValueError, TypeError):
-                    pass
-            
-            # Wind
-            if 'wind_speed' in weather:
-                try:
-                    wind = float(weather['wind_speed'])
-                    lines.append(f"Wind: {wind:.1f} mph")
-                except (ValueError, TypeError):
-                    pass
-        else:
-            # Fallback to summarize_environment if needed
-            env_lines = summarize_environment(env_data)
-            lines.extend(env_lines)
+    # Keep concrete alerts defined in the scanned files
+    alert_classes = {}
+    for name, obj in _ALERT_REGISTRY.items():
+        file_name = modules.get(obj.__module__)
+        if file_name and not inspect.isabstract(obj):
+            logger.info(f"Discovered alert class: {name} in {file_name}")
+            alert_classes[name] = obj
     
-    return lines
+    return alert_classes
 
 
 class FutureAlert:
@@ -348,6 +250,11 @@ class FutureAlert:
 class AlerterMain:
     """Orchestrates satellite alerts, manages per-alert state, logging, and dispatches notifications without duplicates."""
     
+    # Maximum number of alerts forwarded in one notification batch
+    NOTIFY_BATCH_SIZE = 50
+    # Telegram rejects messages longer than this many characters
+    NOTIFY_MAX_CHARS = 4096
+    
     # NOTE FOR AI BOT:
     # This method auto‐discovers all subclasses of Alert—you never need to
     # manually import or list them. If you drop a new scanner here, it'll be
@@ -368,33 +275,14 @@ class AlerterMain:
             List of instantiated Alert objects
         """
         alerts_dir = Path(__file__).parent
-        alert_classes = {}
         alert_params = alert_params or {}
         discovered_alerts = []
         
         # Use project's logging system for discovery process
         logger = configure_alert_logger("alert_discovery")
         
-        # Scan all .py files in the Alerts directory
-        for file_path in alerts_dir.glob("*.py"):
-            if file_path.name.startswith("__") or file_path.name == "alerter_main.py" or file_path.name == "base_alert.py":
-                continue
-                
-            module_name = file_path.stem
-            try:
-                # Import the module dynamically
-                spec = importlib.util.spec_from_file_location(module_name, file_path)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    # Find all classes in the module that inherit from Alert
-                    for name, obj in inspect.getmembers(module, inspect.isclass):
-                        if issubclass(obj, Alert) and obj != Alert:
-                            logger.info(f"Discovered alert class: {name} in {file_path.name}")
-                            alert_classes[name] = obj
-            except Exception as e:
-                logger.error(f"Error importing {file_path.name}: {e}")
+        # Scan the Alerts directory; repeat calls reuse the scan until a file changes
+        alert_classes = _scan_alerts_dir(alerts_dir, _alerts_dir_signature(alerts_dir))
         
         # Instantiate each discovered alert with appropriate parameters
         for class_name, alert_class in alert_classes.items():
@@ -441,6 +329,13 @@ class AlerterMain:
         # Initialize each alert with file bases and seen IDs
         for alert in self.alerts:
             self._initialize_alert(alert)
+        
+        # (alert, file_base, seen set) aligned with self.alerts for the hot loops;
+        # built after every alert is initialized so shared file bases share a set
+        self._alert_pairs = [
+            (alert, self.alert_file_bases[id(alert)], self.seen_ids[self.alert_file_bases[id(alert)]])
+            for alert in self.alerts
+        ]
             
     def _initialize_alert(self, alert):
         """Initialize file base, logging, and state for a single alert.
@@ -452,26 +347,19 @@ class AlerterMain:
             alert: An instance of a subclass of Alert
         """
         # Determine appropriate alert name for logging and state files
-        # Import path may contain slashes, get just the filename
-        module_name = alert.__class__.__name__
-        # Find the actual .py file that contains this class
-        py_file = None
-        for file in os.listdir(self.alerts_dir):
-            if file.endswith('.py') and not file.startswith('__'):
-                # Check if the class is in this file
-                file_path = os.path.join(self.alerts_dir, file)
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    if f'class {module_name}' in content:
-                        py_file = file
-                        break
+        # Find the actual .py file that defines this class - Python already knows it
+        try:
+            py_path = inspect.getsourcefile(alert.__class__)
+        except TypeError:
+            py_path = None
+        if py_path:
+            py_file = os.path.basename(py_path)
+        else:
+            # Fall back to the defining module's name
+            py_file = alert.__class__.__module__.rsplit('.', 1)[-1] + '.py'
         
         # Use the Python filename for logs (without .py extension)
-        if py_file:
-            file_base = os.path.splitext(py_file)[0]
-        else:
-            # Fallback to class name if file not found
-            file_base = module_name
+        file_base = os.path.splitext(py_file)[0]
             
         # Store the file_base mapping for this alert
         self.alert_file_bases[id(alert)] = file_base
@@ -480,9 +368,11 @@ class AlerterMain:
         logger = logging.getLogger(file_base)
         if not logger.handlers:
             logger.setLevel(logging.INFO)
-            # Save log files inside the Alerts folder with file name
+            # Save log files inside the Alerts folder with file name; opened on
+            # the first record. configure_alert_logger() later swaps this for the
+            # queued alert log once the alert fires
             log_path = os.path.join(self.alerts_dir, f"{file_base}.logger")
-            handler = logging.FileHandler(log_path)
+            handler = logging.FileHandler(log_path, delay=True)
             handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
             logger.addHandler(handler)
         # Use same file_base for seen IDs storage
@@ -490,9 +380,7 @@ class AlerterMain:
         seen_file = os.path.join(self.alerts_dir, f"{file_base}.seen.json")
         if os.path.exists(seen_file):
             try:
-                with open(seen_file, 'r') as f:
-                    ids = json.load(f)
-                self.seen_ids[file_base] = set(ids)
+                self.seen_ids[file_base] = _read_seen_file(seen_file)
             except Exception:
                 self.seen_ids[file_base] = set()
         else:
@@ -502,77 +390,92 @@ class AlerterMain:
         """Persist seen IDs for an alert to disk."""
         # Store seen files in the Alerts directory with file base name
         seen_file = os.path.join(self.alerts_dir, f"{file_base}.seen.json")
+        tmp_file = f"{seen_file}.tmp"
         try:
-            with open(seen_file, 'w') as f:
-                json.dump(list(self.seen_ids[file_base]), f)
+            # Write to a temp file and swap it in so a crash never leaves a truncated file
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(list(self.seen_ids[file_base])))
+            os.replace(tmp_file, seen_file)
         except Exception as e:
             print(f"Failed to save seen IDs for {file_base}: {e}")
     
-    def format_alert(self, match, alert_data, alert_type):
+    def send_notifications(self, messages: List[str]):
+        """Send a cycle's formatted alerts as few Telegram messages as possible.
+        
+        Consecutive alerts are joined into one message while they fit within
+        NOTIFY_MAX_CHARS, with at most NOTIFY_BATCH_SIZE alerts per message.
+        If a joined message is rejected (e.g. one alert's Markdown doesn't
+        parse), its alerts are resent one per message so only the bad one is lost.
+        
+        Args:
+            messages: Formatted alert messages in dispatch order
+        """
+        batch = []
+        size = 0
+        for message in messages:
+            extra = len(message) + (2 if batch else 0)
+            if batch and (len(batch) >= self.NOTIFY_BATCH_SIZE or size + extra > self.NOTIFY_MAX_CHARS):
+                self._send_batch(batch)
+                batch = []
+                extra = len(message)
+                size = 0
+            batch.append(message)
+            size += extra
+        if batch:
+            self._send_batch(batch)
+    
+    @staticmethod
+    def _send_batch(batch: List[str]):
+        """Send one joined batch, falling back to one message per alert if it fails."""
+        if send_notification("\n\n".join(batch)) or len(batch) == 1:
+            return
+        for message in batch:
+            send_notification(message)
+    
+    def format_alert(self, match, alert_data, alert_type, ts_str=None):
         """Format an alert with pretty-printing similar to combined_match_summary.
         
         This centralized format function ensures all alerts look consistent.
         
         Args:
-            match: The match data that triggered the alert
+            match: The match data that triggered the alert, or its MatchView
             alert_data: The alert data returned by the alerter (string or dict)
             alert_type: The type of alert (e.g., 'OU3', 'GOAL', etc.)
+            ts_str: Optional pre-formatted Eastern timestamp shared by one pass
             
         Returns:
             str: A formatted alert message
         """
-        # Get the pretty-printed match summary
-        formatted_lines = format_match_summary(match)
-        
-        # Add our custom alert header
-        alert_header = [
-            "\n=====================================",
-            f"🔔 {alert_type.upper()} ALERT 🔔",
-            "=====================================\n"
-        ]
+        # Alert detail lines shown directly under the summary title
+        details = []
+        
+        # Alert types are upper-cased once for the formatter lookup and the header
+        alert_key = alert_type.upper()
         
         # Handle different alert data formats based on the alert type
         if isinstance(alert_data, dict):
-            # New structured alert data format
-            
-            # Handle OU3 alert type
-            if alert_type.upper() == "OU3":
-                if "value" in alert_data and "threshold" in alert_data:
-                    # Format the O/U value with highlighting
-                    formatted_lines.insert(1, f"Over/Under Line: *{alert_data['value']:.2f}* (Threshold: {alert_data['threshold']})")
-                elif "detail" in alert_data:
-                    # Use the provided detail field
-                    formatted_lines.insert(1, f"{alert_data['detail']}")
-            
-            # Handle other alert types as they're added
-            # elif alert_type.upper() == "ANOTHER_TYPE":
-            #    Handle specific formatting for that alert type
-            
-            else:
-                # Generic handling for unknown alert types
-                # Just add any details found in the alert data
-                for key, value in alert_data.items():
-                    if key not in ["type"]:
-                        formatted_lines.insert(1, f"{key.capitalize()}: {value}")
+            # New structured alert data format: per-type formatter, generic otherwise
+            formatter = _ALERT_FORMATTERS.get(alert_key, _format_generic_details)
+            details = formatter(alert_data)
         
         elif isinstance(alert_data, str) and ":" in alert_data:
             # Legacy string format - try to extract details
             try:
                 # Find content between first * pair - this often contains key alert details
-                import re
-                detail_match = re.search(r'\*(.+?)\*', alert_data)
+                detail_match = _ALERT_DETAIL_RE.search(alert_data)
                 if detail_match:
                     detail = detail_match.group(1)
-                    formatted_lines.insert(1, f"{alert_type} Alert Detail: *{detail}*")
+                    details.append(f"{alert_type} Alert Detail: *{detail}*")
                 else:
                     # Just add the raw alert message
-                    formatted_lines.insert(1, f"Alert: {alert_data}")
+                    details.append(f"Alert: {alert_data}")
             except Exception:
                 # If extraction fails, just insert the raw alert message
-                formatted_lines.insert(1, f"Alert: {alert_data}")
+                details.append(f"Alert: {alert_data}")
         
-        # Join all lines into a complete match summary
-        return "\n".join(alert_header + formatted_lines)
+        # Build the pretty-printed match summary under our custom alert header
+        summary = format_match_summary(match, ts_str, details)
+        return f"\n{_ALERT_RULE}\n🔔 {alert_key} ALERT 🔔\n{_ALERT_RULE}\n\n{summary}"
 
     def run(self):
         """[DEPRECATED] Run the alerter to check for any alerts.
@@ -602,48 +505,63 @@ class AlerterMain:
         # rather than go through the merge process again
         merged_matches = raw_data.get('matches', [])
         
+        # One timestamp for the whole pass instead of a timezone lookup per alert
+        ts_str = get_eastern_time().strftime(API_DATETIME_FORMAT)
+        
+        # Formatted alerts are collected and sent together after the loop
+        pending_notifications = []
+        
+        # Alert types with new seen IDs; each is written once after the loop
+        dirty_bases = set()
+        
         # Process each match
         for match in merged_matches:
             # Get the match ID - could be 'match_id' or 'id' depending on the data source
             match_id = match.get("match_id") or match.get("id")
-            for alert in self.alerts:
-                # Use module name for consistency
-                module_name = alert.__class__.__module__.split('.')[-1]
+            # Matches without an ID can't be deduplicated, so no alert may fire
+            if not match_id:
+                continue
+            # Display fields are resolved on the first alert that fires, then shared
+            view = None
+            for alert, file_base, seen in self._alert_pairs:
+                # Already alerted matches can't fire again - skip check()
+                if match_id in seen:
+                    continue
                 notice = alert.check(match)
-                # Only proceed if alert triggers and not already seen
-                if notice and match_id and match_id not in self.seen_ids[self.alert_file_bases[id(alert)]]:
+                # Only proceed if alert triggers
+                if notice:
                     # Format the alert with pretty-printing
-                    formatted_alert = self.format_alert(match, notice, self.alert_file_bases[id(alert)])
+                    if view is None:
+                        view = _normalize_match(match)
+                    formatted_alert = self.format_alert(view, notice, file_base, ts_str)
                     
-                    # Send alert to Telegram
-                    send_notification(formatted_alert)
+                    # Queue alert for Telegram
+                    pending_notifications.append(formatted_alert)
                     
                     # Generate pretty match summary for console display
                     print("\n" + "=" * 80)
-                    print(f"ALERT TRIGGERED: {self.alert_file_bases[id(alert)]}")
+                    print(f"ALERT TRIGGERED: {file_base}")
                     print("=" * 80)
                     print(formatted_alert)
                     
                     # Add to seen match IDs to prevent duplicate alerts
-                    self.seen_ids[self.alert_file_bases[id(alert)]].add(match_id)
-                    self._save_seen(self.alert_file_bases[id(alert)])
+                    seen.add(match_id)
+                    dirty_bases.add(file_base)
                     
                     # Get logger for this specific alert type using centralized configuration
-                    alert_name = self.alert_file_bases[id(alert)]
-                    alert_logger = configure_alert_logger(alert_name)
+                    alert_logger = configure_alert_logger(file_base)
                     
                     # Log the formatted alert
                     if alert_logger and formatted_alert:
                         alert_logger.info(formatted_alert)
-                    
-                # Save home_team, away_team, and status for logger entry
-                home_team = match.get('home_team', {}).get('name', match.get('home', 'Unknown'))
-                away_team = match.get('away_team', {}).get('name', match.get('away', 'Unknown'))
-                score = match.get('score', {})
-                home_score = score.get('home', 0)
-                away_score = score.get('away', 0)
-                status_id = match.get('status_id')
-                status = match.get('status', get_status_description(status_id))
+        
+        # Persist each changed seen set once instead of after every hit
+        for file_base in dirty_bases:
+            self._save_seen(file_base)
+        
+        # Send all alerts from this pass over the shared session
+        if pending_notifications:
+            self.send_notifications(pending_notifications)
 
 
 if __name__ == "__main__":
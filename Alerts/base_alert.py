@@ -36,11 +36,20 @@ Example:
 # define a class that subclasses Alert, and implement check(match). No other
 # files need touching—you'll be auto‐discovered.
 
+from __future__ import annotations
 
 import abc
 import logging
-import traceback
-from typing import Dict, Optional, Union, Any
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Annotations are strings under PEP 563, so the typing names are only needed by type checkers
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Type, Union, Any
+
+
+# Every Alert subclass, keyed by class name; filled in by Alert.__init_subclass__
+_ALERT_REGISTRY: Dict[str, Type["Alert"]] = {}
 
 
 class Alert(abc.ABC):
@@ -49,8 +58,18 @@ class Alert(abc.ABC):
     
     This class enforces a standard interface for all alerts and provides
     common error handling through the safe_check wrapper.
+    
+    Attributes are declared in __slots__ so instances carry no per-instance
+    __dict__; subclasses that add attributes should declare their own slots.
     """
     
+    __slots__ = ("name", "logger")
+    
+    def __init_subclass__(cls, **kwargs):
+        """Register each subclass as it is defined so discovery needs no class scan."""
+        super().__init_subclass__(**kwargs)
+        _ALERT_REGISTRY[cls.__name__] = cls
+    
     def __init__(self, name: str, debug: bool = False):
         """
         Initialize a new alert with a human-readable name.
@@ -59,22 +78,26 @@ class Alert(abc.ABC):
             name: Human-readable name for this alert type
             debug: Whether to enable detailed debug logging to a file
         """
-        from pathlib import Path
-        
         self.name = name
         self.logger = logging.getLogger(name)
         
-        # Optional debug file handler
+        # Optional debug file handler; loggers are process-global, so a repeat
+        # instantiation reuses the handler instead of stacking a duplicate
         if debug:
-            debug_handler = logging.FileHandler(
-                Path(__file__).parent / f"{name}_debug.log"
-            )
-            debug_handler.setLevel(logging.DEBUG)
-            debug_handler.setFormatter(
-                logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-            )
-            self.logger.addHandler(debug_handler)
+            target = str(Path(__file__).parent / f"{name}_debug.log")
+            if not any(
+                isinstance(h, logging.FileHandler) and h.baseFilename == target
+                for h in self.logger.handlers
+            ):
+                debug_handler = logging.FileHandler(target)
+                debug_handler.setLevel(logging.DEBUG)
+                debug_handler.setFormatter(
+                    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+                )
+                self.logger.addHandler(debug_handler)
             self.logger.setLevel(logging.DEBUG)
+            # The debug file has every record; don't also push them through the root logger
+            self.logger.propagate = False
     
     @abc.abstractmethod
     def check(self, match: Dict[str, Any]) -> Optional[Union[str, Dict[str, Any]]]:
@@ -91,6 +114,52 @@ class Alert(abc.ABC):
         """
         pass
     
+    def check_batch(self, matches: List[Dict[str, Any]]) -> List[Optional[Union[str, Dict[str, Any]]]]:
+        """
+        Check several matches at once.
+        
+        The default implementation runs safe_check() on each match. Subclasses
+        can override this with a single-pass implementation.
+        
+        Args:
+            matches: List of match data dictionaries
+            
+        Returns:
+            List aligned with matches holding None or the alert payload
+        """
+        return [self.safe_check(match) for match in matches]
+    
+    def safe_check_batch(self, matches: List[Dict[str, Any]]) -> List[Optional[Union[str, Dict[str, Any]]]]:
+        """
+        Safely execute check_batch with error handling.
+        
+        If the batch raises, fall back to per-match safe_check() so a single
+        bad match can't suppress alerts for the rest of the batch.
+        
+        Args:
+            matches: List of match data dictionaries
+            
+        Returns:
+            List aligned with matches holding None or the alert payload
+        """
+        try:
+            return self.check_batch(matches)
+        except Exception as e:
+            self.logger.error(f"Error in {self.name} batch check, retrying per match: {str(e)}")
+            return [self.safe_check(match) for match in matches]
+    
+    def flush(self, triggered: List[Union[str, Dict[str, Any]]]) -> None:
+        """
+        Receive all payloads this alert fired during one pipeline cycle.
+        
+        Called once per cycle after the alerts have been dispatched, so
+        subclasses can persist or forward them in bulk. The default does nothing.
+        
+        Args:
+            triggered: Alert payloads fired this cycle, in match order
+        """
+        pass
+    
     def safe_check(self, match: Dict[str, Any]) -> Optional[Union[str, Dict[str, Any]]]:
         """
         Safely execute the check method with error handling.
@@ -112,5 +181,7 @@ class Alert(abc.ABC):
             # Log detailed error info but continue processing
             error_msg = f"Error in {self.name} alert checking match {match_id}: {str(e)}"
             self.logger.error(error_msg)
+            # Only needed on this error path, so imported here rather than at load time
+            import traceback
             self.logger.error(traceback.format_exc())
             return None
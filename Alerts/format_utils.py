@@ -7,54 +7,90 @@ import sys
 import os
 from datetime import datetime
 from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Optional
 
-# Add the parent directory to sys.path to ensure imports work correctly
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# combined_match_summary is imported on first use rather than at load time:
+# importing it sets up the summary logger and SIGPIPE handling, which callers
+# that only need _normalize_match shouldn't pay for
+_CMS = None
 
-# Import specific formatting functions from combined_match_summary
-from combined_match_summary import (
-    get_eastern_time, 
-    format_odds_display, 
-    summarize_environment,
-    get_status_description,
-    transform_odds,
-    API_DATETIME_FORMAT
-)
+def _cms():
+    """Return the combined_match_summary module, importing it on first use."""
+    global _CMS
+    if _CMS is None:
+        try:
+            import combined_match_summary
+        except ImportError:
+            # Add the parent directory to sys.path so the import works from Alerts/
+            sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            import combined_match_summary
+        _CMS = combined_match_summary
+    return _CMS
 
-def format_match_summary(match):
-    """Format match data exactly like combined_match_summary.py does.
-    This is a direct duplicate of the formatting code from combined_match_summary.py
-    to ensure consistent pretty-printing throughout the system.
+# Status descriptions indexed by numeric status_id, so the common case is a
+# tuple load; built on first use from combined_match_summary
+_STATUS_DESCRIPTIONS = None
+
+def _status_text(status_id):
+    """Return the description for a status_id, via _STATUS_DESCRIPTIONS when it's an int."""
+    global _STATUS_DESCRIPTIONS
+    if _STATUS_DESCRIPTIONS is None:
+        _STATUS_DESCRIPTIONS = tuple(_cms().get_status_description(i) for i in range(15))
+    if type(status_id) is int and 0 <= status_id < len(_STATUS_DESCRIPTIONS):
+        return _STATUS_DESCRIPTIONS[status_id]
+    return _cms().get_status_description(status_id)
+
+def _intern(value):
+    """Intern short repeated strings (countries, competition names); pass others through."""
+    return sys.intern(value) if type(value) is str else value
+
+def _american(x):
+    """Format a decimal odds value in +130 style, or "+0" when missing."""
+    return f"{int(float(x) * 100):+d}" if x else "+0"
+
+@dataclass(slots=True)
+class MatchView:
+    """Display fields of one match, resolved once from whichever shape the source used."""
+    match_id: Any
+    comp_id: Any
+    comp_name: Any
+    comp_country: Any
+    home_team: Any
+    away_team: Any
+    home_live: Any
+    away_live: Any
+    home_ht: Any
+    away_ht: Any
+    status_id: Any
+    status: Any
+    odds: dict
+    ml: Optional[dict]
+    spread: Optional[dict]
+    ou: Optional[dict]
+    environment: Any
+
+def _normalize_match(match):
+    """Resolve a match's display fields in a single pass.
+    
+    Handles the string/object competition and team formats and the
+    object/array score formats so formatters don't re-walk them per alert.
     
     Args:
         match: The enriched match object from merge_logic
         
     Returns:
-        List of formatted strings representing the match summary
+        MatchView with every field resolved and defaults applied
     """
-    lines = []
-    
-    # Headers and basic info
-    lines.append("\n----- MATCH SUMMARY -----")
-    lines.append("-------------------------")
-    lines.append("")
-    lines.append(f"Timestamp: {get_eastern_time().strftime(API_DATETIME_FORMAT)}")
-    
-    # Try both ID formats
-    match_id = match.get('id') or match.get('match_id', 'Unknown')
-    lines.append(f"Match ID: {match_id}")
+    get = match.get
     
     # Competition info - handle both string format and object format
-    competition = match.get('competition', {})
-    comp_id = None
-    comp_name = None
-    comp_country = None
-    
+    competition = get('competition', {})
     if isinstance(competition, str):
         # Direct string format
         comp_name = competition
-        comp_id = match.get('competition_id', 'Unknown')
-        comp_country = match.get('country', 'Unknown Country')
+        comp_id = get('competition_id', 'Unknown')
+        comp_country = get('country', 'Unknown Country')
     elif isinstance(competition, dict):
         # Object format
         comp_id = competition.get('id')
@@ -62,48 +98,23 @@ def format_match_summary(match):
         comp_country = competition.get('country')
     else:
         # Alternative key formats
-        comp_id = match.get('competition_id')
-        comp_name = match.get('competition_name')
-        comp_country = match.get('country') or match.get('competition_country')
-    
-    # Apply defaults if still missing
-    comp_id = comp_id or 'Unknown'
-    comp_name = comp_name or 'Unknown'
-    comp_country = comp_country or 'Unknown Country'
-    
-    lines.append(f"Competition ID: {comp_id}")
-    lines.append(f"Competition: {comp_name} ({comp_country})")
-    
-    # Team names with fallbacks for different structures
-    home_team = None
-    away_team = None
-    
-    # String access
-    home_team = match.get('home_team')
-    away_team = match.get('away_team')
-    
-    # Object structure access
-    if not isinstance(home_team, str) and isinstance(match.get('home_team', {}), dict) and match.get('home_team', {}).get('name'):
-        home_team = match.get('home_team', {}).get('name')
-    if not isinstance(away_team, str) and isinstance(match.get('away_team', {}), dict) and match.get('away_team', {}).get('name'):
-        away_team = match.get('away_team', {}).get('name')
+        comp_id = get('competition_id')
+        comp_name = get('competition_name')
+        comp_country = get('country') or get('competition_country')
     
-    # Alternate keys
-    home_team = home_team or match.get('home', 'Unknown')
-    away_team = away_team or match.get('away', 'Unknown')
-    
-    lines.append(f"Match: {home_team} vs {away_team}")
+    # Team names: string, object with a name, or alternate keys
+    home_team = get('home_team')
+    away_team = get('away_team')
+    if isinstance(home_team, dict):
+        home_team = home_team.get('name')
+    if isinstance(away_team, dict):
+        away_team = away_team.get('name')
     
     # Score handling for both object and array structures
-    home_live = 0
-    home_ht = 0
-    away_live = 0
-    away_ht = 0
-    
-    # Object structure
-    score = match.get('score', {})
+    home_live = away_live = home_ht = away_ht = 0
+    score = get('score', {})
     if isinstance(score, dict):
-        home_live = score.get('home', 0) 
+        home_live = score.get('home', 0)
         away_live = score.get('away', 0)
         home_ht = score.get('home_ht', 0)
         away_ht = score.get('away_ht', 0)
@@ -115,88 +126,163 @@ def format_match_summary(match):
         if isinstance(as_, list) and len(as_) > 1:
             away_live, away_ht = as_[0], as_[1]
     
-    lines.append(f"Score: {home_live} - {away_live} (HT: {home_ht} - {away_ht})")
+    # Status with rich description, only looked up when the match lacks one
+    status_id = get('status_id')
+    status = match['status'] if 'status' in match else _status_text(status_id)
     
-    # Status with rich description
-    status_id = match.get('status_id')
-    status = match.get('status', get_status_description(status_id))
-    lines.append(f"Status: {status} (Status ID: {status_id})")
+    # Index markets by type in one pass; the last market of each type wins
+    odds = get('odds', {})
+    markets_by_type = {market.get('type'): market for market in odds.get('markets') or ()}
     
-    # Betting Odds section
-    lines.append("\n--- MATCH BETTING ODDS ---")
-    lines.append("--------------------------")
-    lines.append("")
+    return MatchView(
+        match_id=get('id') or get('match_id', 'Unknown'),
+        comp_id=comp_id or 'Unknown',
+        comp_name=_intern(comp_name or 'Unknown'),
+        comp_country=_intern(comp_country or 'Unknown Country'),
+        home_team=home_team or get('home', 'Unknown'),
+        away_team=away_team or get('away', 'Unknown'),
+        home_live=home_live,
+        away_live=away_live,
+        home_ht=home_ht,
+        away_ht=away_ht,
+        status_id=status_id,
+        status=_intern(status),
+        odds=odds,
+        ml=markets_by_type.get('MONEYLINE'),
+        spread=markets_by_type.get('SPREAD'),
+        ou=markets_by_type.get('OVER_UNDER'),
+        environment=get('environment', {}),
+    )
+
+# Fixed section headers of a match summary, rendered once at import
+_SUMMARY_TITLE = "\n----- MATCH SUMMARY -----\n"
+_SUMMARY_RULE = "-------------------------\n\n"
+_ODDS_HDR = "\n\n--- MATCH BETTING ODDS ---\n--------------------------\n"
+_ENV_HDR = "\n\n--- MATCH ENVIRONMENT ---\n-------------------------\n"
 
-    # Handle different odds formats
-    odds_data = match.get('odds', {})
+def _summary_head(view, ts_str, details):
+    """Render the title and basic-info block shared by the summary formatters.
     
-    # Try to extract structured market data
-    eu_data = odds_data.get('eu', [])
-    if eu_data and len(eu_data) > 0:
-        # Format moneyline odds
-        eu_entry = eu_data[0]
-        minute = eu_entry[1] if len(eu_entry) > 1 else "?"
+    Args:
+        view: MatchView for the match
+        ts_str: Pre-formatted Eastern timestamp, or None to use the current time
+        details: Alert detail lines placed directly under the title
         
-        if len(eu_entry) >= 5:
-            home_ml = eu_entry[2]
-            draw_ml = eu_entry[3]
-            away_ml = eu_entry[4]
-            
-            home_str = f"{int(float(home_ml) * 100):+d}" if home_ml else "+0"
-            draw_str = f"{int(float(draw_ml) * 100):+d}" if draw_ml else "+0"
-            away_str = f"{int(float(away_ml) * 100):+d}" if away_ml else "+0"
-            
-            lines.append(f"│ Home: {home_str} │ Draw: {draw_str} │ Away : {away_str} │ (@{minute}')")
+    Returns:
+        The summary text up to and including the status line
+    """
+    if ts_str is None:
+        cms = _cms()
+        ts_str = cms.get_eastern_time().strftime(cms.API_DATETIME_FORMAT)
+    detail_str = "".join(f"{detail}\n" for detail in details)
+    return (
+        f"{_SUMMARY_TITLE}{detail_str}{_SUMMARY_RULE}"
+        f"Timestamp: {ts_str}\n"
+        f"Match ID: {view.match_id}\n"
+        f"Competition ID: {view.comp_id}\n"
+        f"Competition: {view.comp_name} ({view.comp_country})\n"
+        f"Match: {view.home_team} vs {view.away_team}\n"
+        f"Score: {view.home_live} - {view.away_live} (HT: {view.home_ht} - {view.away_ht})\n"
+        f"Status: {view.status} (Status ID: {view.status_id})"
+    )
+
+def _section_body(lines):
+    """Render a section's lines, each on its own line after the header."""
+    return "".join(f"\n{line}" for line in lines)
+
+def _line_value(x):
+    """Format a handicap or goal line to one decimal, or "0.0" when missing."""
+    return f"{float(x):.1f}" if x else "0.0"
+
+# Markets-format odds rows: MatchView attribute, the market's three keys, the
+# formatter for the middle key and the pre-bound row template
+_MARKET_ROWS = (
+    ("ml", "home", "draw", "away", _american,
+     "│ Home  : {} │ Draw  : {} │ Away  : {} │ (@{}')".format),
+    ("spread", "home", "handicap", "away", _line_value,
+     "│ Home  : {} │ Hcap  : {} │ Away  : {} │ (@{}')".format),
+    ("ou", "over", "line", "under", _line_value,
+     "│ Over  : {} │ Line  : {} │ Under : {} │ (@{}')".format),
+)
+# Snapshot minute shown on markets-format rows
+_MARKET_MINUTE = "4"
+
+def format_match_summary(match, ts_str=None, details=()):
+    """Format match data exactly like combined_match_summary.py does.
+    This is a direct duplicate of the formatting code from combined_match_summary.py
+    to ensure consistent pretty-printing throughout the system.
     
-    # Format spread odds
-    asia_data = odds_data.get('asia', [])
-    if asia_data and len(asia_data) > 0:
-        asia_entry = asia_data[0]
-        minute = asia_entry[1] if len(asia_entry) > 1 else "?"
+    Args:
+        match: The enriched match object from merge_logic, or a MatchView
+               already built for it by _normalize_match
+        ts_str: Pre-formatted Eastern timestamp; callers formatting many matches
+                in one pass should compute it once and pass it in
+        details: Alert detail lines placed directly under the summary title
         
-        if len(asia_entry) >= 5:
-            home_hcap = asia_entry[2]
-            hcap = asia_entry[3]
-            away_hcap = asia_entry[4]
-            
-            home_str = f"{int(float(home_hcap) * 100):+d}" if home_hcap else "+0"
-            away_str = f"{int(float(away_hcap) * 100):+d}" if away_hcap else "+0"
-            
-            lines.append(f"│ Home: {home_str} │ Hcap: {hcap} │ Away : {away_str} │ (@{minute}')")
+    Returns:
+        The formatted match summary as a single string
+    """
+    view = match if isinstance(match, MatchView) else _normalize_match(match)
+    odds_lines = []
+    odds_data = view.odds
     
-    # Format over/under odds
-    bs_data = odds_data.get('bs', [])
-    if bs_data and len(bs_data) > 0:
-        bs_entry = bs_data[0]
-        minute = bs_entry[1] if len(bs_entry) > 1 else "?"
-        
-        if len(bs_entry) >= 5:
-            over = bs_entry[2]
-            line = bs_entry[3]
-            under = bs_entry[4]
+    if odds_data.get('markets'):
+        # Markets were already split by type during normalization; format
+        # each present one as in the example (+130 style prices)
+        for attr, first, middle, last, middle_fmt, row_fmt in _MARKET_ROWS:
+            market = getattr(view, attr)
+            if market:
+                odds_lines.append(row_fmt(
+                    _american(market.get(first, 0)),
+                    middle_fmt(market.get(middle, 0)),
+                    _american(market.get(last, 0)),
+                    _MARKET_MINUTE,
+                ))
             
-            over_str = f"{int(float(over) * 100):+d}" if over else "+0"
-            under_str = f"{int(float(under) * 100):+d}" if under else "+0"
-            
-            lines.append(f"│ Over: {over_str} │ Line: {line} │ Under: {under_str} │ (@{minute}')")
+        if not odds_lines:
+            odds_lines.append("No betting odds available")
+    else:
+        # Try the raw eu/asia/bs odds display as fallback for any other odds format
+        odds_lines.append(_cms().format_raw_odds_display(odds_data))
     
-    # Environment info if available
-    env = match.get('environment', {})
-    if env:
-        lines.append("\n--- MATCH ENVIRONMENT ---")
-        lines.append("--------------------------")
-        lines.append("")
-        
-        temp = env.get('temperature')
-        if temp:
-            lines.append(f"Temperature: {temp:.1f}°F")
+    summary = f"{_summary_head(view, ts_str, details)}{_ODDS_HDR}{_section_body(odds_lines)}"
+    
+    # Environment data
+    env_lines = []
+    env_data = view.environment
+    
+    # Format environment exactly as in the example
+    if isinstance(env_data, dict):
+        weather = env_data.get('weather', {})
+        if isinstance(weather, dict):
+            # Temperature
+            temp = weather.get('temperature')
+            if temp is not None:
+                try:
+                    temp_f = float(temp) * 1.8 + 32
+                    env_lines.append(f"Temperature: {temp_f:.1f}°F")
+                except (ValueError, TypeError):
+                    pass
             
-        humidity = env.get('humidity')
-        if humidity:
-            lines.append(f"Humidity: {humidity}%")
+            # Humidity
+            humidity = weather.get('humidity')
+            if humidity is not None:
+                try:
+                    humidity = int(humidity)
+                    env_lines.append(f"Humidity: {humidity}%")
+                except (ValueError, TypeError):
+                    pass
             
-        wind = env.get('wind')
-        if wind:
-            lines.append(f"Wind: {wind:.1f} mph")
+            # Wind
+            wind = weather.get('wind_speed')
+            if wind is not None:
+                try:
+                    wind = float(wind)
+                    env_lines.append(f"Wind: {wind:.1f} mph")
+                except (ValueError, TypeError):
+                    pass
+        else:
+            # Fallback to summarize_environment if needed
+            env_lines.extend(_cms().summarize_environment(env_data))
     
-    return lines
+    return f"{summary}{_ENV_HDR}{_section_body(env_lines)}"
@@ -4,17 +4,23 @@ def check_undefined_vars(filepath):
     src = open(filepath).read()
     tree = ast.parse(src)
     undefined_vars = []
+    known_globals = frozenset(globals())
     
     for node in ast.walk(tree):
         if isinstance(node, ast.FunctionDef):
+            # One walk: record stores, defer loads until every store is known
             locals_defined = set()
+            loads = []
             for n in ast.walk(node):
-                if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store):
-                    locals_defined.add(n.id)
+                if isinstance(n, ast.Name):
+                    if isinstance(n.ctx, ast.Store):
+                        locals_defined.add(n.id)
+                    elif isinstance(n.ctx, ast.Load):
+                        loads.append((n.id, n.lineno))
             
-            for n in ast.walk(node):
-                if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load) and n.id not in locals_defined and n.id not in globals() and n.id != 'self':
-                    undefined_vars.append((node.name, n.id, n.lineno))
+            for name, lineno in loads:
+                if name not in locals_defined and name not in known_globals and name != 'self':
+                    undefined_vars.append((node.name, name, lineno))
     
     print('Potentially undefined variables in functions:')
     for func, var, line in undefined_vars:
@@ -5,6 +5,7 @@ NOTE: All logging configuration is centralized in log_config.py
 """
 # combined_match_summary.py
 import json
+import re
 from datetime import datetime
 import pytz
 import sys
@@ -31,7 +32,9 @@ logger = get_combined_summary_logger()
 logger.debug("Loaded combined_match_summary module")
 
 from zoneinfo import ZoneInfo
-import functools
+import bisect
+import io
+import math
 import signal
 import os
 
@@ -70,6 +73,9 @@ API_DATETIME_FORMAT = "%m/%d/%Y %I:%M:%S %p %Z"
 MATCH_COUNTER_FILE = "match_counters.json"
 MATCH_HEADER_WIDTH = 80
 
+# Rule closing each match summary
+_SUMMARY_FOOTER = "-" * 60
+
 # Test the header formatting with different match numbers
 def test_header_alignment():
     """Test function to verify header alignment"""
@@ -125,8 +131,12 @@ def _get_next_match_id():
     
     return _MATCH_COUNTER
 
-def format_match_summary(match, match_num=None, total_matches=None):
-    """Format a match summary without any I/O operations."""
+def format_match_summary(match, match_num=None, total_matches=None, ts_str=None):
+    """Format a match summary without any I/O operations.
+    
+    Callers formatting a batch of matches should compute ts_str once with
+    get_eastern_time().strftime(API_DATETIME_FORMAT) and pass it in.
+    """
     try:
         # Use provided match_num if given, otherwise use the counter
         if match_num is None:
@@ -137,7 +147,8 @@ def format_match_summary(match, match_num=None, total_matches=None):
             total_matches = match_num
             
         # Get eastern timestamp with the API format
-        ts_str = get_eastern_time().strftime(API_DATETIME_FORMAT)
+        if ts_str is None:
+            ts_str = get_eastern_time().strftime(API_DATETIME_FORMAT)
         
         # Create compact match label
         match_str = f"#MATCH {match_num} of {total_matches}"
@@ -175,13 +186,7 @@ def format_match_summary(match, match_num=None, total_matches=None):
         
         # Betting Odds - with error handling
         try:
-            odds_data = match.get("odds", {})
-            formatted_odds = {
-                "ML": transform_odds(odds_data.get("eu", []), "eu"),
-                "SPREAD": transform_odds(odds_data.get("asia", []), "asia"),
-                "Over/Under": transform_odds(odds_data.get("bs", []), "bs")
-            }
-            odds_display = format_odds_display(formatted_odds)
+            odds_display = format_raw_odds_display(match.get("odds", {}))
         except Exception as e:
             odds_display = "Error formatting odds: " + str(e)
         
@@ -197,18 +202,18 @@ def format_match_summary(match, match_num=None, total_matches=None):
         match_id = match.get('id', 'N/A')
         
         # Consolidate everything into a single multi-line message
-        return f"{match_line}\n{ts_line}\n\nMatch ID: {match_id}\nCompetition ID: {competition_id}\nCompetition: {competition}\nMatch: {teams}\n{score}\n{status}\n\n--- MATCH BETTING ODDS ---\n{odds_display}\n\n--- MATCH ENVIRONMENT ---\n{env_summary}\n\n{'-' * 60}"
+        return f"{match_line}\n{ts_line}\n\nMatch ID: {match_id}\nCompetition ID: {competition_id}\nCompetition: {competition}\nMatch: {teams}\n{score}\n{status}\n\n--- MATCH BETTING ODDS ---\n{odds_display}\n\n--- MATCH ENVIRONMENT ---\n{env_summary}\n\n{_SUMMARY_FOOTER}"
     except Exception as e:
         return f"Error formatting match: {str(e)}\n{traceback.format_exc()}"
 
-def write_combined_match_summary(match, match_num=None, total_matches=None):
+def write_combined_match_summary(match, match_num=None, total_matches=None, ts_str=None):
     """Write a formatted match summary to the logger file.
     
     This is a backward-compatibility wrapper around format_match_summary.
     """
     logger = get_combined_summary_logger()
     try:
-        summary = format_match_summary(match, match_num, total_matches)
+        summary = format_match_summary(match, match_num, total_matches, ts_str)
         if summary.startswith("Error"):
             logger.error(summary)
             return False
@@ -219,56 +224,111 @@ def write_combined_match_summary(match, match_num=None, total_matches=None):
         logger.error(traceback.format_exc())
         return False
 
+def _odds_float(raw_value):
+    """Return raw_value as a finite, nonzero float, or None when it isn't usable odds."""
+    if type(raw_value) is not float:
+        if not raw_value or not isinstance(raw_value, (int, str)):
+            return None
+        try:
+            raw_value = float(raw_value)
+        except ValueError:
+            return None
+    return raw_value if raw_value and math.isfinite(raw_value) else None
+
+def _hk_raw(hk_odds):
+    """hk_to_american for odds already validated by _odds_float, before rounding."""
+    if hk_odds >= 1:
+        return hk_odds * 100
+    return -100 / hk_odds
+
+def _dec_raw(decimal_odds):
+    """decimal_to_american for odds already validated by _odds_float (and != 1), before rounding."""
+    if decimal_odds >= 2.0:
+        return (decimal_odds - 1) * 100
+    return -100 / (decimal_odds - 1)
+
+def _signed_american(value):
+    """Round a converted value to +130 style, or "+0" when it rounds to zero or overflowed."""
+    if not math.isfinite(value):
+        return "+0"
+    amd = int(round(value))
+    return f"{amd:+d}" if amd else "+0"
+
+def _fmt_hk(raw_value):
+    """Format Hong Kong odds (SPREAD, Over/Under) as signed American odds."""
+    hk_odds = _odds_float(raw_value)
+    if hk_odds is None:
+        return "+0"
+    return _signed_american(_hk_raw(hk_odds))
+
+def _fmt_dec(raw_value):
+    """Format decimal odds (ML) as signed American odds."""
+    decimal_odds = _odds_float(raw_value)
+    if decimal_odds is None or decimal_odds == 1:
+        return "+0"
+    return _signed_american(_dec_raw(decimal_odds))
+
+# Converter per market, resolved once per market rather than per odds value
+_FMT_BY_MARKET = {"ML": _fmt_dec, "SPREAD": _fmt_hk, "Over/Under": _fmt_hk}
+
 def format_american_odds(raw_value, market):
     """Format American odds with consistent sign display, using appropriate conversion."""
-    try:
-        # Ensure valid input
-        if raw_value is None or raw_value == "" or raw_value == 0:
-            return "+0"
-            
-        if market in ("SPREAD", "Over/Under"):
-            amd = hk_to_american(raw_value)
-        else:
-            amd = decimal_to_american(raw_value)
-            
-        # Check for valid conversion result
-        if amd == 0:
-            return "+0"
-            
-        return f"{amd:+d}"
-    except Exception as e:
-        return "+0"
+    return _FMT_BY_MARKET.get(market, _fmt_dec)(raw_value)
+
+_STATUS_PAIRS = (
+    ("1", "Not started"), ("2", "First half"), ("3", "Half-time break"),
+    ("4", "Second half"), ("5", "Extra time"), ("6", "Penalty shootout"),
+    ("7", "Finished"), ("8", "Finished"), ("9", "Postponed"),
+    ("10", "Canceled"), ("11", "To be announced"), ("12", "Interrupted"),
+    ("13", "Abandoned"), ("14", "Suspended")
+)
+# Keyed by both the string and int form of each status ID so lookups need no str()
+STATUS_MAP = {**dict(_STATUS_PAIRS), **{int(k): v for k, v in _STATUS_PAIRS}}
 
-@functools.lru_cache(maxsize=32)
 def get_status_description(status_id):
-    status_mapping = {
-        "1": "Not started", "2": "First half", "3": "Half-time break",
-        "4": "Second half", "5": "Extra time", "6": "Penalty shootout",
-        "7": "Finished", "8": "Finished", "9": "Postponed",
-        "10": "Canceled", "11": "To be announced", "12": "Interrupted",
-        "13": "Abandoned", "14": "Suspended"
-    }
-    return status_mapping.get(str(status_id), f"Unknown (ID: {status_id})")
+    # Only exact str/int ids use the map directly; anything else (bool, float, ...)
+    # is matched by its str() form, so True and 2.0 stay unknown
+    if type(status_id) is not str and type(status_id) is not int:
+        status_id = str(status_id)
+    description = STATUS_MAP.get(status_id)
+    if description is None:
+        return f"Unknown (ID: {status_id})"
+    return description
+
+# Minutes whose odds snapshot is preferred for display
+_TARGET_MINUTES = frozenset(("4", "5", "6"))
+
+def _pick_best_index(times):
+    """Return the index of the best odds snapshot given its minute strings, or -1 if none.
+    
+    Single pass: the earliest target-minute snapshot, else the earliest one overall.
+    Non-numeric times sort as 1000; ties keep the first snapshot seen.
+    """
+    # Low-volume markets often carry zero or one snapshot: nothing to compare
+    count = len(times)
+    if count <= 1:
+        return count - 1
+    
+    best = target = -1
+    best_key = target_key = 0
+    for idx, minute in enumerate(times):
+        key = int(minute) if minute.isdigit() else 1000
+        if best < 0 or key < best_key:
+            best, best_key = idx, key
+        if minute in _TARGET_MINUTES and (target < 0 or key < target_key):
+            target, target_key = idx, key
+    
+    return target if target >= 0 else best
 
 def pick_best_entry(entries):
     """Select the best entry from available odds, preferring minutes 4-6"""
     if not entries:
         return {}
-        
-    # Sort entries by time (numeric values first, then non-numeric)
-    entries.sort(key=lambda e: int(e["time_of_match"]) if e.get("time_of_match","").isdigit() else 1000)
+    if len(entries) == 1:
+        return entries[0] if isinstance(entries[0], dict) else {}
     
-    # Target minutes are 4, 5, and 6
-    target_minutes = ["4", "5", "6"]
-    
-    # First try to find an entry within target minutes
-    best_entry = next((e for e in entries if e.get("time_of_match", "") in target_minutes), None)
-    
-    # If no entry found in target minutes, use the first available entry
-    if not best_entry and entries:
-        best_entry = entries[0]
-        
-    return best_entry or {}
+    idx = _pick_best_index([entry.get("time_of_match", "") for entry in entries])
+    return entries[idx] or {}
 
 def transform_odds(raw_odds, odds_type=None):
     """
@@ -312,6 +372,53 @@ def transform_odds(raw_odds, odds_type=None):
         
     return transformed
 
+def _odds_columns(raw_odds):
+    """Split raw odds rows into parallel columns without building a dict per row.
+    
+    Returns:
+        tuple: (times, col_a, col_b, col_c) holding the minute string and the
+        three odds fields of each valid row, in input order
+    """
+    times, col_a, col_b, col_c = [], [], [], []
+    if not raw_odds or not isinstance(raw_odds, list):
+        return times, col_a, col_b, col_c
+    
+    for odds_entry in raw_odds:
+        if not isinstance(odds_entry, list) or len(odds_entry) < 5:
+            continue
+        times.append(str(odds_entry[1]))
+        col_a.append(odds_entry[2])
+        col_b.append(odds_entry[3])
+        col_c.append(odds_entry[4])
+    
+    return times, col_a, col_b, col_c
+
+# First number in a free-form temperature string such as "21.5 C"
+_TEMP_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+# Weather condition mapping
+_WEATHER_CONDITIONS = {
+    "1": "Sunny",
+    "2": "Partly Cloudy",
+    "3": "Cloudy",
+    "4": "Overcast",
+    "5": "Foggy",
+    "6": "Light Rain",
+    "7": "Rain",
+    "8": "Heavy Rain",
+    "9": "Snow",
+    "10": "Thunder"
+}
+
+# Beaufort descriptors: a wind below _BEAUFORT_BREAKS[i] mph (and at or above
+# the previous break) is _BEAUFORT_NAMES[i]; the last name covers the rest
+_BEAUFORT_BREAKS = (1, 4, 8, 13, 19, 25, 32, 39, 47, 55, 64, 73)
+_BEAUFORT_NAMES = (
+    "Calm", "Light Air", "Light Breeze", "Gentle Breeze", "Moderate Breeze",
+    "Fresh Breeze", "Strong Breeze", "Near Gale", "Gale", "Strong Gale",
+    "Storm", "Violent Storm", "Hurricane"
+)
+
 def summarize_environment(env):
     """Format environment data for display"""
     lines = []
@@ -320,44 +427,27 @@ def summarize_environment(env):
     if not env:
         return ["No environment data available"]
         
-    # Weather condition mapping
-    weather_conditions = {
-        "1": "Sunny",
-        "2": "Partly Cloudy",
-        "3": "Cloudy",
-        "4": "Overcast",
-        "5": "Foggy",
-        "6": "Light Rain",
-        "7": "Rain",
-        "8": "Heavy Rain",
-        "9": "Snow",
-        "10": "Thunder"
-    }
-    
     # Weather
     if "weather" in env and env["weather"]:
         weather_code = str(env["weather"])
-        weather_desc = weather_conditions.get(weather_code, f"Unknown ({weather_code})")
+        weather_desc = _WEATHER_CONDITIONS.get(weather_code, f"Unknown ({weather_code})")
         lines.append(f"Weather: {weather_desc}")
     
     # Temperature
     temp = env.get("temperature")
     if temp:
         try:
-            # Check if it has °C marker
-            if "\u00b0C" in temp:
-                temp_val = float(temp.replace("\u00b0C", ""))
-                temp_f = temp_val * 9/5 + 32
-            else:
-                # Try to extract numeric value
-                temp_val = float(''.join(c for c in temp if c.isdigit() or c == '.'))
-                # Assume Celsius if not specified
-                temp_f = temp_val * 9/5 + 32 if env.get("temperature_unit") == "C" or "\u00b0C" in temp else temp_val
-            
-            lines.append(f"Temperature: {temp_f:.1f}°F")
-        except (ValueError, TypeError):
+            # One regex scan for the number; Celsius if marked "°C" or by temperature_unit
+            number = _TEMP_RE.search(temp)
+            is_celsius = "\u00b0C" in temp or env.get("temperature_unit") == "C"
+        except TypeError:
+            number = None
+        if number is None:
             # If parsing fails, show the raw value
             lines.append(f"Temperature: {temp}")
+        else:
+            temp_val = float(number.group())
+            lines.append(f"Temperature: {temp_val * 9/5 + 32 if is_celsius else temp_val:.1f}°F")
     
     # Humidity 
     humidity = env.get("humidity")
@@ -380,32 +470,7 @@ def summarize_environment(env):
                 mph = ms * 2.237
                 
                 # Add wind strength descriptor
-                if mph < 1:
-                    strength = "Calm"
-                elif mph < 4:
-                    strength = "Light Air"
-                elif mph < 8:
-                    strength = "Light Breeze"
-                elif mph < 13:
-                    strength = "Gentle Breeze"
-                elif mph < 19:
-                    strength = "Moderate Breeze"
-                elif mph < 25:
-                    strength = "Fresh Breeze"
-                elif mph < 32:
-                    strength = "Strong Breeze"
-                elif mph < 39:
-                    strength = "Near Gale"
-                elif mph < 47:
-                    strength = "Gale"
-                elif mph < 55:
-                    strength = "Strong Gale"
-                elif mph < 64:
-                    strength = "Storm"
-                elif mph < 73:
-                    strength = "Violent Storm"
-                else:
-                    strength = "Hurricane"
+                strength = _BEAUFORT_NAMES[bisect.bisect_right(_BEAUFORT_BREAKS, mph)]
                 
                 lines.append(f"Wind: {strength}, {mph:.1f} mph")
             else:
@@ -419,184 +484,279 @@ def summarize_environment(env):
 # ────────────────────────────────────────────────────────────────────────────────
 # Unified betting odds display function with precise alignment of numeric values:
 
+_ODDS_MARKETS = ("ML", "SPREAD", "Over/Under")
+_ODDS_LABELS = {"ML": "ML:", "SPREAD": "Spread:", "Over/Under": "O/U:"}
+
 def format_odds_display(formatted_odds):
     """
     Return perfectly aligned betting-odds rows:
        │ Market │ Col1    │ Col2    │ Col3   │ Stamp  │
     """
     rows = []
-    label_map = {"ML":"ML:", "SPREAD":"Spread:", "Over/Under":"O/U:"}
 
-    for market in ("ML", "SPREAD", "Over/Under"):
+    for market in _ODDS_MARKETS:
         entry = pick_best_entry(formatted_odds.get(market, []))
         if not entry:
             continue
             
         time = entry.get("time_of_match", "0")
         stamp = f"(@{time}')"
-        lab = label_map[market]
+        lab = _ODDS_LABELS[market]
+        
+        fmt = _FMT_BY_MARKET[market]
         
         if market == "ML":
-            home_odds = format_american_odds(entry.get('home_win', 0), market)
-            draw_odds = format_american_odds(entry.get('draw', 0), market)
-            away_odds = format_american_odds(entry.get('away_win', 0), market)
+            home_odds = fmt(entry.get('home_win', 0))
+            draw_odds = fmt(entry.get('draw', 0))
+            away_odds = fmt(entry.get('away_win', 0))
             
-            rows.append((lab, f"Home: {home_odds}", f"Draw: {draw_odds}", f"Away: {away_odds}", stamp))
+            rows.append((lab, "Home:", home_odds, "Draw:", draw_odds, "Away:", away_odds, stamp))
             
         elif market == "SPREAD":
-            home_odds = format_american_odds(entry.get('home_win', 0), market)
+            home_odds = fmt(entry.get('home_win', 0))
             handicap = entry.get('handicap', 0)
-            away_odds = format_american_odds(entry.get('away_win', 0), market)
+            away_odds = fmt(entry.get('away_win', 0))
             
-            rows.append((lab, f"Home: {home_odds}", f"Hcap: {handicap}", f"Away: {away_odds}", stamp))
+            rows.append((lab, "Home:", home_odds, "Hcap:", str(handicap), "Away:", away_odds, stamp))
             
         else:  # Over/Under
-            over_odds = format_american_odds(entry.get('over', 0), market)
+            over_odds = fmt(entry.get('over', 0))
             line = entry.get('handicap', 0)
-            under_odds = format_american_odds(entry.get('under', 0), market)
+            under_odds = fmt(entry.get('under', 0))
             
-            rows.append((lab, f"Over: {over_odds}", f"Line: {line}", f"Under: {under_odds}", stamp))
+            rows.append((lab, "Over:", over_odds, "Line:", str(line), "Under:", under_odds, stamp))
     
-    if not rows:
-        return "No betting odds available"
+    return _render_odds_rows(rows)
+
+# Raw odds key feeding each market, and the column labels of its row
+_RAW_ODDS_KEYS = (("ML", "eu"), ("SPREAD", "asia"), ("Over/Under", "bs"))
+_ODDS_COLUMN_LABELS = {
+    "ML": ("Home:", "Draw:", "Away:"),
+    "SPREAD": ("Home:", "Hcap:", "Away:"),
+    "Over/Under": ("Over:", "Line:", "Under:"),
+}
+
+def format_raw_odds_display(odds_data):
+    """
+    Same output as format_odds_display(transform_odds(...) per market), read
+    straight from the raw "eu"/"asia"/"bs" rows of a match's odds.
     
-    # Process each column element to extract labels and values for precise alignment
-    processed_rows = []
+    Only the minute column is scanned; the chosen row is then read by index,
+    so no per-row dicts are built.
+    """
+    rows = []
     
-    for market, col1, col2, col3, stamp in rows:
-        # Extract label and value from each column
-        col1_parts = col1.split(": ", 1)
-        col2_parts = col2.split(": ", 1)
-        col3_parts = col3.split(": ", 1)
+    for market, raw_key in _RAW_ODDS_KEYS:
+        times, col_a, col_b, col_c = _odds_columns(odds_data.get(raw_key, []))
+        if not times:
+            continue
+        idx = _pick_best_index(times)
         
-        if len(col1_parts) == 2 and len(col2_parts) == 2 and len(col3_parts) == 2:
-            # Labels
-            col1_label = col1_parts[0] + ":"
-            col2_label = col2_parts[0] + ":"
-            col3_label = col3_parts[0] + ":"
-            
-            # Values
-            col1_value = col1_parts[1]
-            col2_value = col2_parts[1]
-            col3_value = col3_parts[1]
-            
-            processed_rows.append((market, col1_label, col1_value, col2_label, col2_value, col3_label, col3_value, stamp))
+        fmt = _FMT_BY_MARKET[market]
+        l1, l2, l3 = _ODDS_COLUMN_LABELS[market]
+        # ML's middle column is the draw price; the others show the handicap/line as-is
+        middle = fmt(col_b[idx]) if market == "ML" else str(col_b[idx])
+        rows.append((_ODDS_LABELS[market], l1, fmt(col_a[idx]), l2, middle, l3, fmt(col_c[idx]), f"(@{times[idx]}')"))
     
-    if not processed_rows:
+    return _render_odds_rows(rows)
+
+def _render_odds_rows(rows):
+    """Align (market, label, value, label, value, label, value, stamp) rows into the odds table."""
+    if not rows:
         return "No betting odds available"
     
     # Calculate max widths for precise alignment
-    market_width = max(len(row[0]) for row in processed_rows)
-    col1_label_width = max(len(row[1]) for row in processed_rows)
-    col1_value_width = max(len(row[2]) for row in processed_rows)
-    col2_label_width = max(len(row[3]) for row in processed_rows)
-    col2_value_width = max(len(row[4]) for row in processed_rows)
-    col3_label_width = max(len(row[5]) for row in processed_rows)
-    col3_value_width = max(len(row[6]) for row in processed_rows)
-    stamp_width = max(len(row[7]) for row in processed_rows)
+    market_width = max(len(row[0]) for row in rows)
+    col1_label_width = max(len(row[1]) for row in rows)
+    col1_value_width = max(len(row[2]) for row in rows)
+    col2_label_width = max(len(row[3]) for row in rows)
+    col2_value_width = max(len(row[4]) for row in rows)
+    col3_label_width = max(len(row[5]) for row in rows)
+    col3_value_width = max(len(row[6]) for row in rows)
+    stamp_width = max(len(row[7]) for row in rows)
     
     # Format rows with precise alignment of numeric values
     lines = []
-    for market, c1_label, c1_val, c2_label, c2_val, c3_label, c3_val, stamp in processed_rows:
-        # Format with precise right-alignment of values for perfect odds alignment
-        line = f"│ {market:<{market_width}} │ {c1_label:<{col1_label_width}} {c1_val:>{col1_value_width}} │ "
-        line += f"{c2_label:<{col2_label_width}} {c2_val:>{col2_value_width}} │ "
-        line += f"{c3_label:<{col3_label_width}} {c3_val:>{col3_value_width}} │ {stamp}"
-        lines.append(line)
+    for market, c1_label, c1_val, c2_label, c2_val, c3_label, c3_val, stamp in rows:
+        # Pad labels left and values right so the odds line up; ljust/rjust skip the format-spec parser
+        lines.append(
+            f"│ {market.ljust(market_width)} │ "
+            f"{c1_label.ljust(col1_label_width)} {c1_val.rjust(col1_value_width)} │ "
+            f"{c2_label.ljust(col2_label_width)} {c2_val.rjust(col2_value_width)} │ "
+            f"{c3_label.ljust(col3_label_width)} {c3_val.rjust(col3_value_width)} │ {stamp}"
+        )
     
     return "\n".join(lines)
 
 # ────────────────────────────────────────────────────────────────────────────────
 
+# Per-day match counters, loaded on first use and written back once at exit
+_COUNTERS = None
+# Set when get_match_count changes the counters; a clean flush is skipped
+_COUNTERS_DIRTY = False
+# Resolved at import: when run as a script, __main__.__file__ is gone by atexit time
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _counter_file():
+    return os.path.join(_BASE_DIR, MATCH_COUNTER_FILE)
+
+def _load_counters():
+    """Return the in-memory counters, reading MATCH_COUNTER_FILE on first use."""
+    global _COUNTERS
+    if _COUNTERS is None:
+        try:
+            with open(_counter_file(), 'r') as f:
+                _COUNTERS = json.load(f)
+        except Exception:
+            # Missing or corrupted file: start fresh
+            _COUNTERS = {}
+        atexit.register(_flush_counters)
+    return _COUNTERS
+
+def _flush_counters():
+    """Write the counters to disk via a temp file so a crash can't truncate them."""
+    global _COUNTERS_DIRTY
+    if _COUNTERS is None or not _COUNTERS_DIRTY:
+        return
+    counter_file = _counter_file()
+    tmp_file = counter_file + ".tmp"
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(_COUNTERS, f)
+        os.replace(tmp_file, counter_file)
+        _COUNTERS_DIRTY = False
+    except Exception:
+        # If we can't save, just continue without error
+        pass
+
 def get_match_count():
     """
     Get and update the match count for the day.
     
+    Counters are kept in memory and persisted once at process exit.
+    
     Returns:
         tuple: (current_match_number, total_matches_today)
     """
+    global _COUNTERS_DIRTY
     # Get current date as string
     today = datetime.now().strftime("%Y-%m-%d")
     
-    # Initialize counters if they don't exist
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    counter_file = os.path.join(base_dir, MATCH_COUNTER_FILE)
-    
-    # Load existing counters or initialize
-    counters = {}
-    if os.path.exists(counter_file):
-        try:
-            with open(counter_file, 'r') as f:
-                counters = json.load(f)
-        except Exception:
-            # If file is corrupted, start fresh
-            counters = {}
+    counters = _load_counters()
     
     # Initialize for today if needed
-    if today not in counters:
-        counters[today] = {"total": 0, "current": 0}
-    
-    # Increment total matches for today
-    counters[today]["total"] += 1
-    total_matches = counters[today]["total"]
-    
-    # Increment current match counter
-    counters[today]["current"] += 1
-    current_match = counters[today]["current"]
-    
-    # Save updated counters
-    try:
-        with open(counter_file, 'w') as f:
-            json.dump(counters, f)
-    except Exception:
-        # If we can't save, just continue without error
-        pass
+    day = counters.get(today)
+    if day is None:
+        day = counters[today] = {"total": 0, "current": 0}
+    
+    # Increment total and current match counters for today
+    day["total"] += 1
+    day["current"] += 1
+    _COUNTERS_DIRTY = True
         
-    return (current_match, total_matches)
+    return (day["current"], day["total"])
+
+def format_console_summary(match):
+    """Format the short per-match console echo without any I/O operations."""
+    buf = io.StringIO()
+    write = buf.write
+    write(f"Competition: {match.get('competition')} ({match.get('country')})\n")
+    write(f"Match: {match.get('home_team')} vs {match.get('away_team')}\n")
+
+    # Score
+    home_live = home_ht = away_live = away_ht = 0
+    sd = match.get("score", [])
+    if isinstance(sd, list) and len(sd) > 3:
+        hs, as_ = sd[2], sd[3]
+        if isinstance(hs, list) and len(hs) > 1:
+            home_live, home_ht = hs[0], hs[1]
+        if isinstance(as_, list) and len(as_) > 1:
+            away_live, away_ht = as_[0], as_[1]
+    write(f"Score: {home_live} - {away_live} (HT: {home_ht} - {away_ht})\n")
+
+    # Status
+    sid = match.get("status_id")
+    write(f"Status: {get_status_description(sid)} (Status ID: {sid})\n")
+
+    # Betting Odds
+    write("\n--- MATCH BETTING ODDS ---\n")
+    write(f"{format_raw_odds_display(match.get('odds', {}))}\n")
+
+    # Environment
+    write("\n--- MATCH ENVIRONMENT ---\n")
+    for line in summarize_environment(match.get("environment", {})):
+        write(f"{line}\n")
+    return buf.getvalue()
+
+def _format_match_outputs(match, match_num, total_matches, ts_str):
+    """Format a match's logged summary and console echo together, so a worker receives it once."""
+    return (format_match_summary(match, match_num, total_matches, ts_str),
+            format_console_summary(match))
 
+# Below this many matches the worker start-up costs more than it saves
+_PARALLEL_MIN_MATCHES = 64
 
 if __name__ == "__main__":
     from pathlib import Path
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
     BASE_DIR = Path(__file__).parent
     MERGE_OUTPUT_FILE = BASE_DIR / "merge_logic.json"
     
-    with open(MERGE_OUTPUT_FILE) as f:
-        matches = json.load(f)
+    # Use faster JSON parsing if available
+    try:
+        import orjson
+        matches = orjson.loads(MERGE_OUTPUT_FILE.read_bytes())
+    except ImportError:
+        matches = json.loads(MERGE_OUTPUT_FILE.read_bytes())
+    
+    # One timestamp for the whole run instead of a timezone lookup per match
+    ts_str = get_eastern_time().strftime(API_DATETIME_FORMAT)
+    
+    # Workers come from a forkserver rather than a plain fork of this process,
+    # so they can't inherit the listener thread's logging or queue locks mid-use;
+    # the pool is also set up before that thread starts
+    pool = None
+    if len(matches) >= _PARALLEL_MIN_MATCHES:
+        pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver"))
+    
+    # Summary records are handed to a background listener so the loop never
+    # waits on the log file; the file handlers go back on the logger afterwards
+    from logging.handlers import QueueHandler, QueueListener
+    import queue
+    file_handlers = list(summary_logger.handlers)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+    queue_handler = QueueHandler(log_queue)
+    for handler in file_handlers:
+        summary_logger.removeHandler(handler)
+    summary_logger.addHandler(queue_handler)
+    listener.start()
+    
+    # Counters are taken up front in the main process so workers never touch
+    # match_counters.json; formatting itself has no I/O and can run anywhere
+    counts = [get_match_count() for _ in matches]
+    match_nums = [match_num for match_num, _ in counts]
+    totals = [total_matches for _, total_matches in counts]
+    ts_strs = [ts_str] * len(matches)
     
-    for match in matches:
-        # Get match number and total matches
-        match_num, total_matches = get_match_count()
-        
-        write_combined_match_summary(match, match_num, total_matches)
-        print(f"Competition: {match.get('competition')} ({match.get('country')})")
-        print(f"Match: {match.get('home_team')} vs {match.get('away_team')}")
-        
-        # Score
-        home_live = home_ht = away_live = away_ht = 0
-        sd = match.get("score", [])
-        if isinstance(sd, list) and len(sd) > 3:
-            hs, as_ = sd[2], sd[3]
-            if isinstance(hs, list) and len(hs) > 1:
-                home_live, home_ht = hs[0], hs[1]
-            if isinstance(as_, list) and len(as_) > 1:
-                away_live, away_ht = as_[0], as_[1]
-        print(f"Score: {home_live} - {away_live} (HT: {home_ht} - {away_ht})")
-        
-        # Status
-        sid = match.get("status_id")
-        print(f"Status: {get_status_description(sid)} (Status ID: {sid})")
-        
-        # Betting Odds
-        print("\n--- MATCH BETTING ODDS ---")
-        odds_data = match.get("odds", {})
-        formatted_odds = {
-            "ML": transform_odds(odds_data.get("eu", []), "eu"),
-            "SPREAD": transform_odds(odds_data.get("asia", []), "asia"),
-            "Over/Under": transform_odds(odds_data.get("bs", []), "bs")
-        }
-        print(format_odds_display(formatted_odds))
+    try:
+        if pool is not None:
+            outputs = pool.map(_format_match_outputs, matches, match_nums, totals, ts_strs, chunksize=32)
+        else:
+            outputs = map(_format_match_outputs, matches, match_nums, totals, ts_strs)
         
-        # Environment
-        print("\n--- MATCH ENVIRONMENT ---")
-        for line in summarize_environment(match.get("environment", {})):
-            print(line)
\ No newline at end of file
+        # Results come back in input order; logging stays in this process
+        for summary, echo in outputs:
+            if summary.startswith("Error"):
+                summary_logger.error(summary)
+            else:
+                summary_logger.info(summary)
+            sys.stdout.write(echo)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        listener.stop()
+        summary_logger.removeHandler(queue_handler)
+        for handler in file_handlers:
+            summary_logger.addHandler(handler)
@@ -1,5 +1,16 @@
 import ast
 
+class LoggerFinder(ast.NodeVisitor):
+    """Collect (lineno, context) for every `logger` Name under the visited node."""
+    
+    def __init__(self):
+        self.refs = []
+    
+    def visit_Name(self, node):
+        if node.id == "logger":
+            self.refs.append((node.lineno, "Store" if isinstance(node.ctx, ast.Store) else "Load"))
+        self.generic_visit(node)
+
 def print_logger_references():
     with open("orchestrate_complete.py", "r") as file:
         src = file.read()
@@ -10,10 +21,9 @@ def print_logger_references():
     for node in tree.body:
         if isinstance(node, ast.AsyncFunctionDef) and node.name == "run_complete_pipeline":
             # Find all logger references
-            logger_refs = []
-            for subnode in ast.walk(node):
-                if isinstance(subnode, ast.Name) and subnode.id == "logger":
-                    logger_refs.append((subnode.lineno, "Store" if isinstance(subnode.ctx, ast.Store) else "Load"))
+            finder = LoggerFinder()
+            finder.visit(node)
+            logger_refs = sorted(finder.refs)
             
             print(f"Found {len(logger_refs)} references to 'logger' in run_complete_pipeline:")
             for line, ctx in logger_refs:
@@ -5,13 +5,17 @@ Simple script to find remaining logger references in the run_complete_pipeline f
 import re
 from pathlib import Path
 
+# Body of run_complete_pipeline, up to the next AI-bot note or end of file
+_FN_PAT = re.compile(r'async def run_complete_pipeline\(\):(.*?)(?=\n\n# NOTE FOR AI BOT:|$)', re.DOTALL)
+# Bare `logger` name; word boundaries skip summary_logger and friends
+_LOG_PAT = re.compile(r'\blogger\b')
+
 def find_logger_references():
     with open(Path(__file__).parent / "orchestrate_complete.py", "r") as f:
         content = f.read()
     
     # Find the run_complete_pipeline function
-    pattern = r'async def run_complete_pipeline\(\):(.*?)(?=\n\n# NOTE FOR AI BOT:|$)'
-    match = re.search(pattern, content, re.DOTALL)
+    match = _FN_PAT.search(content)
     
     if not match:
         print("Could not find run_complete_pipeline function")
@@ -20,14 +24,13 @@ def find_logger_references():
     function_code = match.group(1)
     
     # Find all logger references
-    logger_refs = re.findall(r'\blogger\b', function_code)
+    ref_count = sum(1 for _ in _LOG_PAT.finditer(function_code))
     
-    print(f"Found {len(logger_refs)} references to 'logger' in run_complete_pipeline")
+    print(f"Found {ref_count} references to 'logger' in run_complete_pipeline")
     
-    # Show code context for each reference
-    for i, line in enumerate(function_code.split('\n')):
-        if 'logger' in line:
-            line_num = i + 1  # Adjust for 1-based line numbering
+    # Show code context for each reference, matching lines the same way as the count
+    for line_num, line in enumerate(function_code.splitlines(), 1):
+        if _LOG_PAT.search(line):
             print(f"Line {line_num}: {line.strip()}")
 
 if __name__ == "__main__":
@@ -50,6 +50,9 @@ import os
 import pytz
 import time
 import datetime
+import queue
+import atexit
+import logging.handlers
 from logging.handlers import TimedRotatingFileHandler
 
 # Custom handler to prepend new log entries at the top of log files
@@ -315,6 +318,37 @@ LOGGING_CONFIG = {
 # Dictionary to track alert loggers that have been configured
 _configured_alert_loggers = set()
 
+# Alert log records are queued by the alert loggers and written to each
+# alert's log file by one background listener thread
+_ALERT_LOG_QUEUE = queue.SimpleQueue()
+_ALERT_FILE_HANDLERS = {}
+_alert_log_listener = None
+
+class _AlertFileRouter(logging.Handler):
+    """Hand each queued record to the file handler of the alert logger that emitted it."""
+    
+    def emit(self, record):
+        handler = _ALERT_FILE_HANDLERS.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+def _start_log_listener():
+    """Start the shared alert log listener on first use; it drains on exit."""
+    global _alert_log_listener
+    if _alert_log_listener is None:
+        _alert_log_listener = logging.handlers.QueueListener(_ALERT_LOG_QUEUE, _AlertFileRouter())
+        _alert_log_listener.start()
+        atexit.register(_stop_log_listener)
+
+def _stop_log_listener():
+    """Drain the alert log queue, then close the alert file handlers."""
+    global _alert_log_listener
+    if _alert_log_listener is not None:
+        _alert_log_listener.stop()
+        _alert_log_listener = None
+    for handler in _ALERT_FILE_HANDLERS.values():
+        handler.close()
+
 def configure_logging():
     """Configure all loggers using dictConfig.
     This should be called once at application startup.
@@ -419,7 +453,8 @@ def configure_alert_logger(alert_name):
         filename=log_file,
         when="midnight",
         backupCount=30,
-        encoding="utf8"
+        encoding="utf8",
+        delay=True
     )
     handler.setFormatter(logging.Formatter("%(message)s"))
     
@@ -431,7 +466,11 @@ def configure_alert_logger(alert_name):
         logger.removeHandler(h)
         h.close()
     
-    logger.addHandler(handler)
+    # The logger only enqueues; the listener thread writes the file through
+    # the router, so alerting never blocks on disk
+    _ALERT_FILE_HANDLERS[alert_name] = handler
+    logger.addHandler(logging.handlers.QueueHandler(_ALERT_LOG_QUEUE))
+    _start_log_listener()
     logger.setLevel(logging.INFO)
     logger.propagate = False
     
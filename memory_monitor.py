@@ -12,6 +12,7 @@ Usage:
     3. Call end_cycle_monitoring() at the end of each cycle
     4. Call log_cache_sizes() after caches are loaded or updated
     5. Use dump_gc_stats() to analyze garbage collection at key points
+       (set MEMMON_DEEP=1 for the full heap scan; otherwise only cheap GC counters are logged)
 
 Author: Sports Bot Team
 Date: 2025-05-15
@@ -20,42 +21,90 @@ Date: 2025-05-15
 import os
 import sys
 import gc
+import heapq
 import time
 import logging
 import subprocess
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 import psutil
 
 # Create a dedicated logger for memory monitoring
-logging.basicConfig(level=logging.INFO)
+if not logging.root.handlers:
+    logging.basicConfig(level=logging.INFO)
 monitor_logger = logging.getLogger("memory_monitor")
 
-# Create a file handler for the memory monitor
+# Create a file handler for the memory monitor; the file is only opened on
+# the first record, so importing this module doesn't hold a descriptor
 log_dir = Path(__file__).parent / "logs" / "memory"
 log_dir.mkdir(exist_ok=True, parents=True)
 log_file = log_dir / "memory_monitor.log"
 
-file_handler = logging.FileHandler(log_file)
-file_handler.setLevel(logging.INFO)
 formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
-file_handler.setFormatter(formatter)
+
+# Attach each handler only once, even if the module is loaded again
+# (e.g. run as __main__ and imported under its own name)
+if not any(isinstance(h, logging.FileHandler) and h.baseFilename == str(log_file)
+           for h in monitor_logger.handlers):
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(formatter)
+    monitor_logger.addHandler(file_handler)
 
 # Add a console handler for immediate feedback
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-console_handler.setFormatter(formatter)
+if not any(type(h) is logging.StreamHandler for h in monitor_logger.handlers):
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+    monitor_logger.addHandler(console_handler)
+
+# Handle on this process, created once; psutil caches per-process state on it
+_PROC = psutil.Process()
+
+def get_process():
+    """Return the shared psutil.Process handle for this process."""
+    return _PROC
+
+# Samples younger than this many seconds are reused instead of re-reading procfs
+_SAMPLE_TTL = 0.5
+# Last (rss_mb, fd_count, fd_error, monotonic timestamp) read by _cached_sample
+_last_sample = None
+
+def _cached_sample(ttl=_SAMPLE_TTL):
+    """Return (rss_mb, fd_count, fd_error), re-reading them at most once per ttl seconds.
+    
+    fd_count is None and fd_error holds the exception when the FD count
+    couldn't be read.
+    """
+    global _last_sample
+    now = time.monotonic()
+    if _last_sample is not None and now - _last_sample[3] < ttl:
+        return _last_sample[:3]
+    
+    with _PROC.oneshot():
+        rss = _PROC.memory_info().rss / (1024*1024)
+        try:
+            fd_count, fd_error = _PROC.num_fds(), None
+        except (psutil.Error, OSError) as e:
+            fd_count, fd_error = None, e
+    _last_sample = (rss, fd_count, fd_error, now)
+    return rss, fd_count, fd_error
+
+def deep_scan_enabled():
+    """Return True when MEMMON_DEEP is set, enabling full heap scans."""
+    return bool(os.environ.get("MEMMON_DEEP"))
 
-# Add handlers to the logger
-monitor_logger.addHandler(file_handler)
-monitor_logger.addHandler(console_handler)
+def cycle_active():
+    """Return True between start_cycle_monitoring() and end_cycle_monitoring()."""
+    return _cycle_start_time is not None
 
 # Global variables to track state
 _cycle_start_time = None
 _cycle_start_rss = None
 _cycle_count = 0
 _baseline_loggers = set()
-_baseline_objects = {}
+_baseline_objects = Counter()
 
 def _initialize_baselines():
     """Capture initial state of loggers and objects to detect growth."""
@@ -65,15 +114,17 @@ def _initialize_baselines():
     _baseline_loggers = set(logging.Logger.manager.loggerDict.keys())
     monitor_logger.info(f"Baseline loggers: {len(_baseline_loggers)}")
     
-    # Capture initial object counts
-    _baseline_objects = {}
-    for obj in gc.get_objects():
-        t = type(obj).__name__
-        _baseline_objects[t] = _baseline_objects.get(t, 0) + 1
+    # Capture initial object counts, keyed by type; names are only looked up for display.
+    # Like dump_gc_stats, the heap walk only happens in deep mode
+    if not deep_scan_enabled():
+        _baseline_objects = Counter()
+        monitor_logger.info("Baseline object types: skipped (set MEMMON_DEEP=1 to scan the heap)")
+        return
+    _baseline_objects = Counter(map(type, gc.get_objects()))
     
     monitor_logger.info(f"Baseline object types: {len(_baseline_objects)}")
-    for t, cnt in sorted(_baseline_objects.items(), key=lambda x: -x[1])[:5]:
-        monitor_logger.info(f"  {t}: {cnt}")
+    for t, cnt in _baseline_objects.most_common(5):
+        monitor_logger.info(f"  {t.__name__}: {cnt}")
 
 def start_cycle_monitoring():
     """Call at the beginning of each processing cycle to start monitoring."""
@@ -83,40 +134,40 @@ def start_cycle_monitoring():
     if _cycle_count == 0:
         _initialize_baselines()
     
-    # Get current process
-    proc = psutil.Process()
-    
     # Record start time and RSS
     _cycle_start_time = time.time()
-    _cycle_start_rss = proc.memory_info().rss / (1024*1024)
+    _cycle_start_rss, fd_count, fd_error = _cached_sample()
     
     # Log cycle start
     monitor_logger.info(f"[CYCLE {_cycle_count}] ===== CYCLE START =====")
     monitor_logger.info(f"[CYCLE {_cycle_count}] Start RSS: {_cycle_start_rss:.1f} MB")
     
     # Check file descriptors
-    try:
-        fd_count = len(os.listdir(f"/proc/{proc.pid}/fd"))
+    if fd_error is None:
         monitor_logger.info(f"[CYCLE {_cycle_count}] Start FD count: {fd_count}")
-    except (FileNotFoundError, PermissionError) as e:
-        monitor_logger.warning(f"[CYCLE {_cycle_count}] Cannot check FDs: {e}")
+    else:
+        monitor_logger.warning(f"[CYCLE {_cycle_count}] Cannot check FDs: {fd_error}")
 
 def end_cycle_monitoring():
-    """Call at the end of each processing cycle to log memory stats."""
+    """Call at the end of each processing cycle to log memory stats.
+    
+    Returns:
+        Counter of live objects keyed by type object (format with t.__name__)
+        from the end-of-cycle GC dump, empty unless MEMMON_DEEP is set,
+        or None if no cycle was started
+    """
     global _cycle_start_time, _cycle_start_rss, _cycle_count
     
     if _cycle_start_time is None:
         monitor_logger.warning("end_cycle_monitoring() called without start_cycle_monitoring()")
         return
     
-    # Get current process
-    proc = psutil.Process()
-    
     # Calculate cycle duration
     duration = time.time() - _cycle_start_time
     
-    # Get end RSS and calculate delta
-    end_rss = proc.memory_info().rss / (1024*1024)
+    # Get end RSS and calculate delta; always a fresh reading, since a short
+    # cycle would otherwise get the start-of-cycle sample back
+    end_rss, fd_count, fd_error = _cached_sample(ttl=0)
     delta_rss = end_rss - _cycle_start_rss
     
     # Log cycle completion stats
@@ -126,29 +177,32 @@ def end_cycle_monitoring():
     monitor_logger.info(f"[CYCLE {_cycle_count}] Delta RSS: {delta_rss:+.1f} MB")
     
     # Check file descriptors
-    try:
-        fd_count = len(os.listdir(f"/proc/{proc.pid}/fd"))
+    if fd_error is None:
         monitor_logger.info(f"[CYCLE {_cycle_count}] End FD count: {fd_count}")
-    except (FileNotFoundError, PermissionError) as e:
-        monitor_logger.warning(f"[CYCLE {_cycle_count}] Cannot check FDs: {e}")
+    else:
+        monitor_logger.warning(f"[CYCLE {_cycle_count}] Cannot check FDs: {fd_error}")
     
     # Check for new loggers
     current_loggers = set(logging.Logger.manager.loggerDict.keys())
     new_loggers = current_loggers - _baseline_loggers
     if new_loggers:
         monitor_logger.warning(f"[CYCLE {_cycle_count}] New loggers: {len(new_loggers)}")
-        monitor_logger.warning(f"[CYCLE {_cycle_count}] New logger names: {sorted(new_loggers)[:10]}")
+        monitor_logger.warning(f"[CYCLE {_cycle_count}] New logger names: {heapq.nsmallest(10, new_loggers)}")
     
     monitor_logger.info(f"[CYCLE {_cycle_count}] Total loggers: {len(current_loggers)}")
     
-    # Dump GC stats at the end of each cycle
-    dump_gc_stats(cycle=_cycle_count)
+    # Dump GC stats at the end of each cycle; after the forced full collection
+    # every surviving object sits in generation 2, so that's the one scan needed
+    counts = dump_gc_stats(cycle=_cycle_count, generation=2)
     
     # Increment cycle count for next run
     _cycle_count += 1
     
     # Reset start time
     _cycle_start_time = None
+    
+    # Callers reuse the histogram instead of walking the heap again
+    return counts
 
 def log_cache_sizes(teams_cache=None, comp_cache=None, country_map=None, custom_caches=None):
     """Log the sizes of various cache structures.
@@ -180,7 +234,7 @@ def dump_logger_stats():
     loggers = list(logging.Logger.manager.loggerDict.keys())
     monitor_logger.info(f"Active loggers: {len(loggers)}")
     if loggers:
-        monitor_logger.info(f"Logger names (first 10): {sorted(loggers)[:10]}")
+        monitor_logger.info(f"Logger names (first 10): {heapq.nsmallest(10, loggers)}")
     
     # Check for handlers that might buffer data
     memory_handlers = []
@@ -196,58 +250,68 @@ def dump_logger_stats():
     if memory_handlers:
         monitor_logger.warning(f"Found potential memory-buffering handlers: {memory_handlers}")
 
-def dump_gc_stats(cycle=None):
-    """Dump garbage collection statistics and top object counts."""
+def dump_gc_stats(cycle=None, generation=None):
+    """Dump garbage collection statistics and top object counts.
+    
+    Args:
+        cycle: Cycle number used to prefix the log lines
+        generation: Restrict the heap scan to this GC generation
+    
+    Returns:
+        Counter of live objects by type; empty unless MEMMON_DEEP is set
+    """
+    prefix = f"[CYCLE {cycle}] " if cycle is not None else ""
+    
+    # The forced collection and heap walk are opt-in; by default log only
+    # the counters the interpreter already keeps
+    if not deep_scan_enabled():
+        monitor_logger.info(f"{prefix}GC counts: {gc.get_count()}")
+        monitor_logger.info(f"{prefix}GC stats: {gc.get_stats()}")
+        monitor_logger.info(f"{prefix}GC garbage: {len(gc.garbage)}")
+        monitor_logger.info(f"{prefix}Allocated blocks: {sys.getallocatedblocks()}")
+        return Counter()
+    
     # Force garbage collection
     collected = gc.collect()
     
-    # Get counts of objects by type
-    counts = {}
-    for obj in gc.get_objects():
-        t = type(obj).__name__
-        counts[t] = counts.get(t, 0) + 1
+    # Get counts of objects by type in a single pass over the heap
+    objects = gc.get_objects() if generation is None else gc.get_objects(generation)
+    counts = Counter(map(type, objects))
     
-    # Compare with baseline
-    object_deltas = {}
-    for t, count in counts.items():
-        baseline = _baseline_objects.get(t, 0)
-        delta = count - baseline
-        if delta != 0:
-            object_deltas[t] = delta
+    # Compare with baseline, keeping only the types whose count changed
+    baseline_get = _baseline_objects.get
+    object_deltas = {t: delta for t, count in counts.items()
+                     if (delta := count - baseline_get(t, 0))}
     
     # Log the top object types
-    prefix = f"[CYCLE {cycle}] " if cycle is not None else ""
     monitor_logger.info(f"{prefix}GC collected {collected} objects")
     monitor_logger.info(f"{prefix}Top 5 object types by count:")
-    for t, cnt in sorted(counts.items(), key=lambda x: -x[1])[:5]:
-        monitor_logger.info(f"{prefix}  {t}: {cnt}")
+    for t, cnt in counts.most_common(5):
+        monitor_logger.info(f"{prefix}  {t.__name__}: {cnt}")
     
     # Log the top growing object types
     monitor_logger.info(f"{prefix}Top 5 growing object types:")
-    for t, delta in sorted(object_deltas.items(), key=lambda x: -abs(x[1]))[:5]:
+    for t, delta in heapq.nlargest(5, object_deltas.items(), key=lambda x: abs(x[1])):
         if delta > 0:
-            monitor_logger.warning(f"{prefix}  {t}: +{delta}")
+            monitor_logger.warning(f"{prefix}  {t.__name__}: +{delta}")
         else:
-            monitor_logger.info(f"{prefix}  {t}: {delta}")
+            monitor_logger.info(f"{prefix}  {t.__name__}: {delta}")
     
     return counts
 
 def check_file_descriptor_count():
     """Check the number of open file descriptors for the current process."""
-    proc = psutil.Process()
-    try:
-        fd_count = len(os.listdir(f"/proc/{proc.pid}/fd"))
-        monitor_logger.info(f"Open file descriptors: {fd_count}")
-        return fd_count
-    except (FileNotFoundError, PermissionError) as e:
-        monitor_logger.warning(f"Cannot check file descriptors: {e}")
+    _, fd_count, fd_error = _cached_sample(ttl=0)
+    if fd_error is not None:
+        monitor_logger.warning(f"Cannot check file descriptors: {fd_error}")
         return None
+    monitor_logger.info(f"Open file descriptors: {fd_count}")
+    return fd_count
 
 if __name__ == "__main__":
     """When run directly, show current memory usage."""
     monitor_logger.info("=== Memory Monitor Test ===")
-    proc = psutil.Process()
-    rss = proc.memory_info().rss / (1024*1024)
+    rss = _PROC.memory_info().rss / (1024*1024)
     monitor_logger.info(f"Current RSS: {rss:.1f} MB")
     
     check_file_descriptor_count()
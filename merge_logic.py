@@ -123,31 +123,31 @@ def merge_match_data(
     merged['id'] = match_id  # Ensure match ID is included
     merged['competition_id'] = comp_id  # Add competition ID
     
-    _log.debug(f"Base merge complete for match {match_id}")
-    _log.debug(f"Included competition_id: {comp_id} in match data")
+    _log.debug("Base merge complete for match %s", match_id)
+    _log.debug("Included competition_id: %s in match data", comp_id)
 
     # 2) Team names with improved logging - use IDs passed in from extract_ids
     # Note: We use the IDs passed in (which may come from details if live doesn't have them)
     if home_id not in team_cache:
-        _log.debug(f"[{match_id}] home_team_id '{home_id}' not in team_cache")
+        _log.debug("[%s] home_team_id '%s' not in team_cache", match_id, home_id)
     merged["home_team"] = extract_team_name(team_cache.get(home_id, {}))
     
     if away_id not in team_cache:
-        _log.debug(f"[{match_id}] away_team_id '{away_id}' not in team_cache")
+        _log.debug("[%s] away_team_id '%s' not in team_cache", match_id, away_id)
     merged["away_team"] = extract_team_name(team_cache.get(away_id, {}))
 
     # 3) Competition and country with improved logging - use comp_id passed in from extract_ids
     if comp_id not in competition_cache:
-        _log.debug(f"[{match_id}] competition_id '{comp_id}' not in competition_cache")
+        _log.debug("[%s] competition_id '%s' not in competition_cache", match_id, comp_id)
     
     comp_name, country_id = extract_competition_info(competition_cache.get(comp_id, {}))
     merged["competition"] = comp_name
     
     if country_id is None:
-        _log.debug(f"[{match_id}] competition cache had no country_id")
+        _log.debug("[%s] competition cache had no country_id", match_id)
     merged["country"] = country_map.get(country_id, "Unknown Country")
     
-    _log.debug(f"Added competition '{comp_name}' and country info for match {match_id}")
+    _log.debug("Added competition '%s' and country info for match %s", comp_name, match_id)
 
     # 4) Odds formatting
     merged["odds"] = format_match_odds(odds)
@@ -156,7 +156,7 @@ def merge_match_data(
     status_id = merged.get("status_id")
     merged["status"] = get_status_description(status_id)
     
-    _log.debug(f"Completed merging match {match_id} (status: {merged['status']})")
+    _log.debug("Completed merging match %s (status: %s)", match_id, merged["status"])
     return merged
 
 
@@ -187,11 +187,11 @@ def merge_all_matches(
             _log.warning(f"No odds entry for match {mid}")
         odds = odds_by_id.get(mid, {})  # Renamed from 'odd' to 'odds' for clarity
         
-        _log.debug(f"Merging match {mid} with {len(detail)} detail keys and {len(odds)} odds keys")
+        _log.debug("Merging match %s with %d detail keys and %d odds keys", mid, len(detail), len(odds))
         
         # Extract team and competition IDs using both match and details data
         home_id, away_id, comp_id = extract_ids(match, detail)
-        _log.debug(f"Using IDs home={home_id}, away={away_id}, comp={comp_id}")
+        _log.debug("Using IDs home=%s, away=%s, comp=%s", home_id, away_id, comp_id)
         
         merged = merge_match_data(match, detail, odds,
                                   team_cache,
@@ -99,18 +99,26 @@ import gc
 import json
 import logging
 import os
-import psutil
 import pytz
 import signal
 import subprocess
 import sys
 import time
 import traceback
+from collections import Counter
 from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union, Any
 
+# Parse the full cache with orjson when available; json.loads also takes the
+# raw bytes, so neither path decodes the file into an intermediate str
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import memory monitoring tool
 sys.path.append(str(Path(__file__).parent))
 import memory_monitor
@@ -158,10 +166,14 @@ from summary_json_generator import write_summary_json
 
 # Import the alert system
 from Alerts.alerter_main import AlerterMain
+from Alerts.format_utils import _normalize_match
 from Alerts.base_alert import Alert  # Base class for all alerts
 
 # Define the complete status_id sequence in logical order:
 DESIRED_STATUS_ORDER = ["1","2","3","4","5","6","7","8","9","10","11","12","13","14"]
+# Position of each status_id in DESIRED_STATUS_ORDER; unknown ids sort last
+_STATUS_RANK = {s: i for i, s in enumerate(DESIRED_STATUS_ORDER)}
+_STATUS_FALLBACK = len(DESIRED_STATUS_ORDER)
 
 def sort_by_status(matches):
     """
@@ -176,11 +188,7 @@ def sort_by_status(matches):
     """
     return sorted(
         matches,
-        key=lambda m: (
-            DESIRED_STATUS_ORDER.index(m.get("status_id")) 
-            if m.get("status_id") in DESIRED_STATUS_ORDER 
-            else len(DESIRED_STATUS_ORDER)
-        )
+        key=lambda m: _STATUS_RANK.get(m.get("status_id"), _STATUS_FALLBACK)
     )
 
 # Constants
@@ -228,37 +236,46 @@ def get_eastern_time():
 
 # Prepending logic moved to wrapper script
 
+# Read-only stand-in for missing sub-objects in unpack_full_cache; never mutated
+_EMPTY = {}
+
 def unpack_full_cache(full_cache: dict):
-    live = {"results": []}
+    matches = full_cache.get("matches", [])
+    results = [None] * len(matches)
+    live = {"results": results}
     details = {}
     odds = {}
     team_cache = {}
     comp_cache = {}
     country_map = {}
 
-    for m in full_cache.get("matches", []):
-        mid = m.get("match_id")
-        basic = m.get("basic_info", {})
-        live["results"].append(basic)
-        details[mid] = m.get("details", {})
-        odds[mid] = m.get("odds", {})
+    for i, m in enumerate(matches):
+        get = m.get
+        mid = get("match_id")
+        results[i] = get("basic_info", {})
+        details[mid] = get("details", {})
+        odds[mid] = get("odds", {})
+        enriched = get("enriched") or _EMPTY
 
         # teams
-        for role in ("home_team", "away_team"):
-            t = m.get("enriched", {}).get(role, {})
-            tid = t.get("id")
-            if tid:
-                team_cache[tid] = t
+        t = enriched.get("home_team") or _EMPTY
+        tid = t.get("id")
+        if tid:
+            team_cache[tid] = t
+        t = enriched.get("away_team") or _EMPTY
+        tid = t.get("id")
+        if tid:
+            team_cache[tid] = t
 
         # competition
-        comp = m.get("enriched", {}).get("competition", {})
+        comp = enriched.get("competition") or _EMPTY
         cid = comp.get("id")
         if cid:
             comp_cache[cid] = comp
 
         # country
         country_id = comp.get("country_id")
-        country_name = m.get("metadata", {}).get("country_name")
+        country_name = (get("metadata") or _EMPTY).get("country_name")
         if country_id and country_name:
             country_map[country_id] = country_name
 
@@ -304,12 +321,7 @@ async def run_complete_pipeline():
                 raise PipelineError(error_msg)
                 
             try:
-                # Use faster JSON parsing if available
-                try:
-                    import orjson
-                    full_cache = orjson.loads(FULL_CACHE_FILE.read_bytes())
-                except ImportError:
-                    full_cache = json.loads(FULL_CACHE_FILE.read_text())
+                full_cache = _json_loads(FULL_CACHE_FILE.read_bytes())
             except FileNotFoundError:
                 error_msg = f"Missing file: {FULL_CACHE_FILE}"
                 summary_logger.error(error_msg)
@@ -330,7 +342,11 @@ async def run_complete_pipeline():
                     team_cache, comp_cache, country_map
                 )
             
-            merged_data = [{"created_at": get_eastern_time(), **m} for m in merged_data]
+            # One timestamp for the whole cycle; records merge_all_matches already
+            # stamped keep their own, as they did with the {"created_at": ..., **m} copy
+            created_at = get_eastern_time()
+            for m in merged_data:
+                m.setdefault("created_at", created_at)
             merged_data = sort_by_status(merged_data)
             
             summary_logger.debug(f"Merged {len(merged_data)} records")
@@ -343,10 +359,13 @@ async def run_complete_pipeline():
                 
                 # Prepare all summaries first
                 reversed_matches = list(reversed(merged_data))
+                total = len(reversed_matches)
                 summaries = []
+                # All summaries in one batch share a single timestamp
+                ts_str = get_eastern_time()
                 
                 for idx, match in enumerate(reversed_matches, 1):
-                    summary = format_match_summary(match, idx, len(reversed_matches))
+                    summary = format_match_summary(match, idx, total, ts_str)
                     if not summary.startswith("Error"):
                         summaries.append(summary)
                 
@@ -374,8 +393,10 @@ async def run_complete_pipeline():
         total_time = time.time() - start_time
         summary_logger.info(f"✅ Pipeline completed in {total_time:.2f} seconds")
         
-        # Dump garbage collection stats
-        memory_monitor.dump_gc_stats()
+        # Dump garbage collection stats, unless the cycle monitor will do it
+        # in end_cycle_monitoring()
+        if not memory_monitor.cycle_active():
+            memory_monitor.dump_gc_stats()
 
 # NOTE FOR AI BOT:
 # This is the single entry point for alerts in the main pipeline.
@@ -413,47 +434,65 @@ async def run_alerters(summary_json, match_ids=None):
         ]
         summary_logger.info(f"Filtered to {len(matches_to_process)} matches based on match_ids")
     
-    # Process each match through all alerts
+    # Normalize match IDs once; matches without an ID can't be deduplicated
+    candidates = []
     for match in matches_to_process:
-        # Ensure we have a match_id in the expected format
         match_id = str(match.get("match_id") or match.get("id") or "")
-        if not match_id:
+        if match_id:
+            candidates.append((match_id, match))
+    
+    # Run each alert over all unseen matches in one batch, then dispatch the
+    # cycle's alerts together instead of one round trip per alert
+    messages = []
+    # A match firing several alerts is normalized for display only once
+    views = {}
+    # Alert timestamps share one Eastern-time lookup per cycle
+    ts_str = get_eastern_time()
+    for alert, file_base_id, seen in alerter._alert_pairs:
+        
+        # Skip matches we've already processed for this alert
+        pending = [(match_id, match) for match_id, match in candidates if match_id not in seen]
+        if not pending:
             continue
-            
-        # Check each registered alert
-        for alert in alerter.alerts:
-            # Get the file base ID for this alert for deduplication
-            file_base_id = alerter.alert_file_bases[id(alert)]
-            
-            # Skip if we've already processed this match for this alert
-            if match_id in alerter.seen_ids[file_base_id]:
+        
+        notices = alert.safe_check_batch([match for _, match in pending])
+        triggered = []
+        
+        for (match_id, match), notice in zip(pending, notices):
+            if not notice:
                 continue
+            # Format and process the alert
+            try:
+                # Format the alert message using AlerterMain's formatter
+                view = views.get(match_id)
+                if view is None:
+                    view = views[match_id] = _normalize_match(match)
+                message = alerter.format_alert(view, notice, alert.name, ts_str)
                 
-            # Check if this alert triggers for the current match
-            notice = alert.safe_check(match)
-            
-            if notice:
-                # Format and process the alert
-                try:
-                    # Format the alert message using AlerterMain's formatter
-                    message = alerter.format_alert(match, notice, alert.name)
-                    
-                    # Log the alert
-                    summary_logger.debug(f"Alert {alert.name} triggered for match {match_id}")
-                    alert.logger.info(message)
-                    
-                    # Send notification through the alerter's notification system
-                    alerter.send_notification(message)
-                    
-                    # Mark as seen for deduplication
-                    alerter.seen_ids[file_base_id].add(match_id)
-                    alerter._save_seen(file_base_id)
-                    
-                except Exception as e:
-                    summary_logger.error(
-                        f"Error processing alert {alert.name} for match {match_id}: {str(e)}",
-                        exc_info=True
-                    )
+                # Log the alert
+                summary_logger.debug("Alert %s triggered for match %s", alert.name, match_id)
+                alert.logger.info(message)
+                
+                messages.append(message)
+                triggered.append(notice)
+                
+                # Mark as seen for deduplication
+                seen.add(match_id)
+                
+            except Exception as e:
+                summary_logger.error(
+                    f"Error processing alert {alert.name} for match {match_id}: {str(e)}",
+                    exc_info=True
+                )
+        
+        if triggered:
+            # Persist seen IDs once per alert and hand the batch to the alert
+            alerter._save_seen(file_base_id)
+            alert.flush(triggered)
+    
+    # Send notifications through the alerter's notification system
+    if messages:
+        alerter.send_notifications(messages)
 
 def print_instructions():
     """Print instructions for scheduling the pipeline using cron"""
@@ -488,13 +527,13 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Initialize process and memory monitoring
-    proc = psutil.Process(os.getpid())
+    proc = memory_monitor.get_process()
     start_mem = proc.memory_info().rss / (1024*1024)
     logger.info(f"Starting memory: {start_mem:.1f} MB")
     
     # Check for open file descriptors
     try:
-        fd_count = len(os.listdir(f"/proc/{proc.pid}/fd"))
+        fd_count = proc.num_fds()
         logger.info(f"Initial FD count: {fd_count}")
     except Exception as e:
         logger.warning(f"Could not check file descriptors: {e}")
@@ -521,8 +560,8 @@ if __name__ == "__main__":
         # Run the pipeline
         asyncio.run(run_complete_pipeline())
         
-        # End memory monitoring
-        memory_monitor.end_cycle_monitoring()
+        # End memory monitoring; its GC dump's histogram is reused below
+        object_counts = memory_monitor.end_cycle_monitoring()
         
         # Print current memory usage after pipeline run
         curr_mem = proc.memory_info().rss / (1024*1024)
@@ -540,39 +579,12 @@ if __name__ == "__main__":
             
         logger.info(f"Current logger count: {len(logging.Logger.manager.loggerDict)}")
         
-        # Count top types of objects with performance measurement
-        import time
-        t0 = time.perf_counter()
-        objs = gc.get_objects()
-        t1 = time.perf_counter()
-        logger.info(f"[DIAG] GC introspection: {len(objs)} objects in {t1-t0:.2f}s")
-        
-        # Only analyze in detail if it's reasonably fast
-        if t1-t0 < 0.5:  # Only process if taking less than 0.5 seconds
-            counts = {}
-            for obj in objs:
-                obj_type = type(obj).__name__
-                if obj_type not in counts:
-                    counts[obj_type] = 0
-                counts[obj_type] += 1
-            
-            # Log top 10 most common object types
-            top_types = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Top object types from the end-of-cycle GC dump, without another heap walk
+        if object_counts:
+            top_types = [(t.__name__, cnt) for t, cnt in object_counts.most_common(10)]
             summary_logger.debug(f"Top 10 object types: {top_types}")
-        else:
-            summary_logger.warning(f"[DIAG] Skipping detailed object analysis as GC introspection took {t1-t0:.2f}s")
-            # Use sampling instead
-            import itertools
-            sample_counts = {}
-            for obj in itertools.islice(objs, 1000):  # Sample first 1000 objects
-                obj_type = type(obj).__name__
-                if obj_type not in sample_counts:
-                    sample_counts[obj_type] = 0
-                sample_counts[obj_type] += 1
-            
-            # Log sampled object types
-            sampled_types = sorted(sample_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-            summary_logger.debug(f"Top 10 object types (sampled): {sampled_types}")
+        elif object_counts is not None:
+            summary_logger.debug("Top 10 object types: skipped (set MEMMON_DEEP=1 to scan the heap)")
         
         logger.info("\n===== ALL CYCLES COMPLETE =====")
         logger.info("Memory monitoring complete. Check logs/memory/memory_monitor.log for detailed results.")
@@ -593,29 +605,28 @@ if __name__ == "__main__":
         cleanup_handlers()
         logger.info("[DIAG] Finished cleanup handlers")
         
-        # Count top types of objects with performance measurement
-        import time
-        t0 = time.perf_counter()
-        objs = gc.get_objects()
-        t1 = time.perf_counter()
-        logger.info(f"[DIAG] GC introspection: {len(objs)} objects in {t1-t0:.2f}s")
-        
-        # Only proceed with object counting if it's reasonably fast
-        if t1-t0 < 0.5:  # Only process if taking less than 0.5 seconds
-            counts = {}
-            for obj in objs:
-                t = type(obj).__name__
-                counts[t] = counts.get(t, 0) + 1
-            for t, cnt in sorted(counts.items(), key=lambda x: -x[1])[:5]:
-                summary_logger.debug(f"  {t}: {cnt}")
+        # Count top types of objects with performance measurement; this walks
+        # the whole heap, so like the cycle GC dump it only runs in deep mode
+        if not memory_monitor.deep_scan_enabled():
+            logger.info("[DIAG] GC introspection skipped (set MEMMON_DEEP=1 to scan the heap)")
         else:
-            summary_logger.warning(f"[DIAG] Skipping detailed object analysis as GC introspection took {t1-t0:.2f}s")
-            # Use sampling instead
-            import itertools
-            sample_counts = {}
-            for obj in itertools.islice(objs, 1000):  # Sample first 1000 objects
-                t = type(obj).__name__
-                sample_counts[t] = sample_counts.get(t, 0) + 1
-            summary_logger.debug("[DIAG] Top 5 object types (from 1000-object sample):")
-            for t, cnt in sorted(sample_counts.items(), key=lambda x: -x[1])[:5]:
-                summary_logger.debug(f"  {t}: {cnt} (sampled)")
+            import time
+            t0 = time.perf_counter()
+            objs = gc.get_objects()
+            t1 = time.perf_counter()
+            logger.info(f"[DIAG] GC introspection: {len(objs)} objects in {t1-t0:.2f}s")
+        
+            # Only proceed with object counting if it's reasonably fast
+            if t1-t0 < 0.5:  # Only process if taking less than 0.5 seconds
+                counts = Counter(map(type, objs))
+                for t, cnt in counts.most_common(5):
+                    summary_logger.debug(f"  {t.__name__}: {cnt}")
+            else:
+                summary_logger.warning(f"[DIAG] Skipping detailed object analysis as GC introspection took {t1-t0:.2f}s")
+                # Use sampling instead
+                import itertools
+                # Sample first 1000 objects
+                sample_counts = Counter(map(type, itertools.islice(objs, 1000)))
+                summary_logger.debug("[DIAG] Top 5 object types (from 1000-object sample):")
+                for t, cnt in sample_counts.most_common(5):
+                    summary_logger.debug(f"  {t.__name__}: {cnt} (sampled)")
@@ -11,11 +11,22 @@ cd "$(dirname "$0")"
 # Ensure logs directory exists with absolute path
 mkdir -p /root/Complete_Seperate/logs
 
+# Log this shell's RSS and open FD count, read straight from /proc so no
+# ps/ls/wc processes are forked just to report them
+log_usage() {
+    local key value rss=0
+    while read -r key value _; do
+        if [ "$key" = "VmRSS:" ]; then rss=$value; break; fi
+    done < /proc/$$/status
+    local fds=(/proc/$$/fd/*)
+    echo "${1}RSS: ${rss}kB, FDs: ${#fds[@]}" >> /root/Complete_Seperate/logs/cron.log
+}
+
 # Log start timestamp and PID
 echo "$(date) STARTING pipeline (PID $$)" >> /root/Complete_Seperate/logs/cron.log
 
 # Log initial resource usage
-echo "RSS: $(ps -o rss= -p $$)kB, FDs: $(ls /proc/$$/fd | wc -l)" >> /root/Complete_Seperate/logs/cron.log
+log_usage
 
 # Print Python info for debugging
 echo "$(date) Using Python: $(which python)" >> /root/Complete_Seperate/logs/cron.log
@@ -37,7 +48,7 @@ source ./sports_venv/bin/activate
     echo "$(date) EXIT code $EXIT_CODE" >> /root/Complete_Seperate/logs/cron.log
     
     # Log final resource usage
-    echo "Final RSS: $(ps -o rss= -p $$)kB, FDs: $(ls /proc/$$/fd | wc -l)" >> /root/Complete_Seperate/logs/cron.log
+    log_usage "Final "
     
     # Alert on non-zero exit code
     if [ $EXIT_CODE -ne 0 ]; then
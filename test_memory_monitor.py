@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# test_memory_monitor.py - Unit tests for the per-cycle memory monitor
+
+import os
+import re
+import unittest
+from unittest import mock
+
+import memory_monitor
+
+class TestCycleMonitoring(unittest.TestCase):
+    """Test the start/end cycle RSS readings."""
+
+    def test_end_rss_reflects_allocation_during_short_cycle(self):
+        """End-of-cycle RSS must be re-read even when the cycle is shorter than the sample TTL."""
+        with self.assertLogs("memory_monitor", level="INFO") as logs:
+            memory_monitor.start_cycle_monitoring()
+            # Touch every page so the allocation shows up in RSS
+            block = bytearray(b"\x01") * (64 * 1024 * 1024)
+            memory_monitor.end_cycle_monitoring()
+        del block
+
+        deltas = [float(m.group(1)) for line in logs.output
+                  if (m := re.search(r"Delta RSS: ([+-][\d.]+) MB", line))]
+        self.assertEqual(len(deltas), 1)
+        self.assertGreater(deltas[0], 32.0)
+
+    def test_deep_gc_counts_are_keyed_by_type(self):
+        """In deep mode the end-of-cycle histogram is keyed by type objects, not names."""
+        with mock.patch.dict(os.environ, {"MEMMON_DEEP": "1"}), \
+                self.assertLogs("memory_monitor", level="INFO"):
+            memory_monitor.start_cycle_monitoring()
+            counts = memory_monitor.end_cycle_monitoring()
+
+        self.assertTrue(counts)
+        self.assertTrue(all(isinstance(t, type) for t in counts))
+        self.assertGreater(counts[dict], 0)
+
+if __name__ == "__main__":
+    unittest.main()
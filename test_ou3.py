@@ -70,5 +70,64 @@ class TestOverUnderAlert(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result["line"], 4.0)  # Still picks highest timestamp
 
+    def test_legacy_bs_odds(self):
+        """Test the line is taken from raw bs rows when no over_under map exists."""
+        legacy = {**self.match, "odds": {"bs": [[300, "12", 0.90, "3.5", 0.95]]}}
+        result = self.alert.safe_check(legacy)
+        
+        self.assertIsNotNone(result)
+        self.assertEqual(result["line"], 3.5)
+        self.assertEqual(result["over"], 0.90)
+        self.assertEqual(result["timestamp"], 300)
+    
+    def test_check_batch(self):
+        """Test batch checking returns results aligned with the input matches."""
+        finished = {**self.match, "status_id": "5"}
+        results = self.alert.check_batch([self.match, finished, self.match])
+        
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["line"], 4.0)
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2], results[0])
+
+    def test_check_msgpack(self):
+        """Test the MsgPack variant encodes the same payload as check()."""
+        try:
+            import msgpack
+        except ImportError:
+            self.skipTest("msgpack not installed")
+        packed = self.alert.check_msgpack(self.match)
+        self.assertEqual(msgpack.unpackb(packed), self.alert.check(self.match))
+        self.assertIsNone(self.alert.check_msgpack({**self.match, "status_id": "5"}))
+    
+    def test_compiled_check_matches_check(self):
+        """Test the compiled closure returns the same payloads as check()."""
+        check = OverUnderAlert.compile(3.0)
+        finished = {**self.match, "status_id": "5"}
+        low = {**self.match, "odds": {"bs": [[1, "3", 0.9, "2.5", 0.9]]}}
+        for match in (self.match, finished, low, {}):
+            self.assertEqual(check(match), self.alert.check(match))
+    
+    def test_large_batch_matches_scalar_path(self):
+        """Test large batches give the same results whether or not NumPy is used."""
+        import Alerts.OU3 as ou3
+        finished = {**self.match, "status_id": "5"}
+        low = {**self.match, "odds": {"bs": [[1, "3", 0.9, "2.5", 0.9]]}}
+        nan_line = {**self.match, "odds": {"over_under": {"1": {"line": "nan", "timestamp": 1}}}}
+        matches = [self.match, finished, low, nan_line] * 400
+        
+        vectorized = self.alert.check_batch(matches)
+        saved_np, ou3.np = ou3.np, None
+        try:
+            scalar = self.alert.check_batch(matches)
+        finally:
+            ou3.np = saved_np
+        
+        # Compare which matches fired first so a mismatch fails without a huge diff
+        fired = [i for i, r in enumerate(scalar) if r is not None]
+        self.assertEqual([i for i, r in enumerate(vectorized) if r is not None], fired)
+        self.assertEqual(vectorized, scalar)
+        self.assertEqual(len(fired), 800)
+
 if __name__ == "__main__":
     unittest.main()